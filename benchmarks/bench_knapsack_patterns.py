@@ -0,0 +1,55 @@
+"""对比无缺陷原料上 DFS 与有界背包格点枚举（core.knapsack_patterns）的模式数和耗时
+
+运行: python -m benchmarks.bench_knapsack_patterns
+"""
+import time
+
+import numpy as np
+
+from cutting import core
+from benchmarks.bench_maximal_patterns import segments
+
+lengths = [5.5, 6.2, 7.8]
+
+
+def synthetic_segments(n, seed=0):
+    """n 种零件，长度 0.4~2.5 米，需求 2~12 件"""
+    rng = np.random.default_rng(seed)
+    return [{'name': f"seg{j}", 'length': round(float(rng.uniform(0.4, 2.5)), 2), 'demand': int(rng.integers(2, 13))}
+            for j in range(n)]
+
+
+def run_dfs(length, segs, options):
+    start = time.perf_counter()
+    found = {counts: kerf_units for counts, kerf_units in core.iter_patterns(length, [], segs, **options)}
+    return found, time.perf_counter() - start
+
+
+def run_knapsack(length, segs, options, max_counts=None):
+    start = time.perf_counter()
+    counts, kerf_units = core.knapsack_patterns(core.to_units(length), segs, max_counts=max_counts, **options)
+    elapsed = time.perf_counter() - start
+    return {tuple(row.tolist()): int(k) for row, k in zip(counts, kerf_units)}, elapsed
+
+
+def main():
+    print(f"{'零件种数':<8}{'原料(m)':>8}{'模式':>10}{'DFS模式数':>10}{'DFS(s)':>10}{'格点(s)':>10}"
+          f"{'加速':>8}{'按需求封顶':>10}")
+    catalogs = [(len(segments), segments, {'free_end_cut': True})]
+    catalogs += [(n, synthetic_segments(n), {}) for n in (12, 16)]
+    for n, segs, base in catalogs:
+        caps = [seg['demand'] for seg in segs]
+        for length in lengths:
+            for maximal_only in (False, True):
+                options = dict(base, maximal_only=maximal_only)
+                dfs, dfs_time = run_dfs(length, segs, options)
+                lattice, lattice_time = run_knapsack(length, segs, options)
+                assert dfs == lattice, "两种枚举结果不一致"
+                capped, _ = run_knapsack(length, segs, options, caps)
+                mode = 'maximal' if maximal_only else 'all'
+                print(f"{n:<8}{length:>8}{mode:>10}{len(dfs):>10}{dfs_time:>10.3f}{lattice_time:>10.4f}"
+                      f"{dfs_time / lattice_time:>8.1f}{len(capped):>10}")
+
+
+if __name__ == "__main__":
+    main()
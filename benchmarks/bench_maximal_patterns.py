@@ -0,0 +1,50 @@
+"""对比全部模式与极大模式（maximal_only）的列数、求解时间和最优成本
+
+运行: python -m benchmarks.bench_maximal_patterns
+"""
+import time
+
+import pulp
+from pulp import value
+
+from cutting import instances, model, store
+
+# 问题1的订单与原料
+segments = instances.question_1().segments
+materials = instances.question_1().materials
+
+
+def run(segs, mats, free_end_cut, maximal_only):
+    start = time.perf_counter()
+    all_patterns = store.PatternStore(segs)
+    for mat in mats:
+        all_patterns.add_material(mat['length'], mat['cost'], mat.get('defects', []),
+                                  free_end_cut=free_end_cut, maximal_only=maximal_only)
+    gen_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prob, _ = model.build_pulp_model("Bench_Maximal", all_patterns, segs)
+    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    solve_time = time.perf_counter() - start
+    return len(all_patterns), gen_time, solve_time, value(prob.objective)
+
+
+def main():
+    print(f"{'实例':<10}{'模式':<10}{'列数':>8}{'生成(s)':>10}{'求解(s)':>10}{'最优成本':>12}")
+    q3 = instances.question_3()
+    cases = [
+        ('问题1', segments, materials, True),
+        ('问题3', q3.segments, q3.materials, False),
+    ]
+    for label, segs, mats, free_end_cut in cases:
+        costs = []
+        for maximal_only in (False, True):
+            n, gen_time, solve_time, cost = run(segs, mats, free_end_cut, maximal_only)
+            costs.append(cost)
+            mode = 'maximal' if maximal_only else 'all'
+            print(f"{label:<10}{mode:<10}{n:>8}{gen_time:>10.3f}{solve_time:>10.3f}{cost:>12.2f}")
+        assert abs(costs[0] - costs[1]) < 1e-6, "极大模式改变了最优成本"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""分阶段基准：载入、模式生成、PuLP 建模、求解各自计时，记录模式数、目标值和峰值内存，结果存为 JSON
+
+实例包括随附的问题1/2/3（固定基线）和按原料长度、零件种数、需求量级、每根缺陷数组合出的合成实例。
+每个实例在新启动的子进程里运行，峰值内存互不影响；生成模式不读写磁盘缓存、不开多进程。
+
+运行: python -m benchmarks.bench_pipeline
+      python -m benchmarks.bench_pipeline --only q --compare benchmarks/results/<旧提交>.json
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from cutting import core, instances, metrics, model, parallel, solvers
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# 合成实例的默认网格
+LENGTHS = [6.0, 9.0]
+SEGMENT_TYPES = [5, 8]
+DEMANDS = [20, 200]
+DEFECTS = [0, 2]
+BARS = 10
+
+
+def synthetic_instance(stock_length, n_segments, demand, defects_per_bar, n_bars=BARS, seed=0):
+    """n_segments 种零件（0.4~2.5 米，需求在 demand 的 0.5~1.5 倍之间），n_bars 根同长原料，
+    每根在均分的 defects_per_bar 段里各放一个缺陷，缺陷互不重叠；单价按长度计"""
+    rng = np.random.default_rng([seed, int(stock_length * 1000), n_segments, demand, defects_per_bar])
+    segments = [{'name': f"seg{j}", 'length': round(float(rng.uniform(0.4, 2.5)), 2),
+                 'demand': max(1, int(rng.integers(demand // 2, demand * 3 // 2 + 1))), 'price': 0}
+                for j in range(n_segments)]
+    materials = []
+    slot = stock_length / max(defects_per_bar, 1)
+    for _ in range(n_bars):
+        defects = []
+        for k in range(defects_per_bar):
+            length = round(float(rng.uniform(0.02, 0.2)), 2)
+            start = round(float(k * slot + rng.uniform(0, slot - length)), 2)
+            defects.append({'start': start, 'length': length})
+        materials.append({'length': stock_length, 'cost': round(stock_length * 3.5, 2), 'defects': defects})
+    name = f"L{stock_length:g}-S{n_segments}-D{demand}-F{defects_per_bar}"
+    return instances.Instance(name, segments, materials, {'maximal_only': True})
+
+
+def instance_specs(args):
+    """(名称, 构造参数)；在子进程里再构造实例，载入阶段的耗时也计入"""
+    specs = [(name, ('shipped', name)) for name in instances.SHIPPED]
+    for length, n, demand, defects in itertools.product(args.lengths, args.segment_types, args.demands,
+                                                        args.defects):
+        spec = ('synthetic', (length, n, demand, defects, args.bars, args.seed))
+        specs.append((synthetic_instance(*spec[1]).name, spec))
+    return [(name, spec) for name, spec in specs if args.only is None or args.only in name]
+
+
+def peak_rss_mb():
+    """本进程的峰值常驻内存（MB），含解释器与已导入模块；平台不支持时为 None"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 以 KB 计，macOS 以字节计
+    return peak / (1 << 20 if platform.system() == 'Darwin' else 1 << 10)
+
+
+def run_instance(spec, backend_name='highs'):
+    import pulp
+
+    phases = {}
+    start = time.perf_counter()
+    kind, params = spec
+    instance = instances.SHIPPED[params]() if kind == 'shipped' else synthetic_instance(*params)
+    groups = core.group_materials(instance.materials)
+    phases['load'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    patterns = parallel.generate_store(groups, instance.segments, workers=1, use_cache=False,
+                                       max_counts=instance.max_counts, **instance.options)
+    phases['generate'] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    prob, pattern_vars = model.build_pulp_model("Bench_Pipeline", patterns, instance.segments)
+    phases['build'] = time.perf_counter() - start
+
+    # CBC 直接解上面建好的模型；其他后端由 scipy 接口自建稀疏矩阵，这部分耗时计入求解
+    start = time.perf_counter()
+    if backend_name == 'cbc':
+        prob.solve(pulp.PULP_CBC_CMD(msg=False))
+        feasible = prob.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible)
+        status = 'optimal' if prob.sol_status == pulp.LpSolutionOptimal else 'feasible' if feasible else 'infeasible'
+        x = np.array([var.value() or 0 for var in pattern_vars], dtype=float)
+    else:
+        result = solvers.get_backend(backend_name).solve(patterns, instance.segments)
+        feasible = result.feasible
+        status = 'optimal' if result.optimal else 'feasible' if feasible else 'infeasible'
+        x = result.x
+    phases['solve'] = time.perf_counter() - start
+
+    summary = metrics.compute_metrics(patterns, instance.segments, x) if feasible else None
+    return {
+        'instance': instance.name,
+        'bars': len(instance.materials),
+        'groups': len(groups),
+        'segment_types': len(instance.segments),
+        'patterns': len(patterns),
+        'status': status,
+        'objective': round(summary.total_cost, 2) if feasible else None,
+        'utilization': summary.utilization if feasible else None,
+        'phases': phases,
+        'total': sum(phases.values()),
+        'peak_rss_mb': peak_rss_mb(),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True, cwd=os.path.dirname(RESULTS_DIR)).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path):
+    """与旧结果逐实例对比总耗时和目标值"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {r['instance']: r for r in json.load(f)['results']}
+    print(f"\n对比 {baseline_path}")
+    print(f"{'实例':<20}{'旧(s)':>10}{'新(s)':>10}{'比值':>8}{'目标值变化':>12}")
+    for r in results:
+        old = baseline.get(r['instance'])
+        if old is None:
+            continue
+        ratio = r['total'] / old['total'] if old['total'] else float('nan')
+        delta = None if r['objective'] is None or old['objective'] is None else r['objective'] - old['objective']
+        print(f"{r['instance']:<20}{old['total']:>10.3f}{r['total']:>10.3f}{ratio:>8.2f}"
+              f"{'-' if delta is None else f'{delta:+.2f}':>12}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='分阶段基准')
+    parser.add_argument('--lengths', type=float, nargs='+', default=LENGTHS, help='合成实例的原料长度（米）')
+    parser.add_argument('--segment-types', type=int, nargs='+', default=SEGMENT_TYPES)
+    parser.add_argument('--demands', type=int, nargs='+', default=DEMANDS, help='每种零件需求的量级（根）')
+    parser.add_argument('--defects', type=int, nargs='+', default=DEFECTS, help='每根原料的缺陷数')
+    parser.add_argument('--bars', type=int, default=BARS, help='合成实例的原料根数')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', default=None, help='只运行名称中含此字符串的实例')
+    parser.add_argument('--backend', choices=list(solvers.BACKENDS), default='highs')
+    parser.add_argument('-o', '--output', default=None, help='JSON 结果路径，默认 benchmarks/results/<提交>.json')
+    parser.add_argument('--compare', default=None, help='与此前的 JSON 结果对比')
+    args = parser.parse_args()
+
+    print(f"{'实例':<20}{'模式数':>8}{'载入':>8}{'生成':>8}{'建模':>8}{'求解':>8}{'峰值MB':>8}{'目标值':>12}")
+    results = []
+    # 每个实例一个新进程（spawn 才支持 max_tasks_per_child），子进程的峰值内存只含该实例
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context('spawn'),
+                             max_tasks_per_child=1) as pool:
+        for name, spec in instance_specs(args):
+            r = pool.submit(run_instance, spec, args.backend).result()
+            results.append(r)
+            p = r['phases']
+            rss = '-' if r['peak_rss_mb'] is None else f"{r['peak_rss_mb']:.0f}"
+            objective = r['status'] if r['objective'] is None else f"{r['objective']:.2f}"
+            print(f"{name:<20}{r['patterns']:>8}{p['load']:>8.3f}{p['generate']:>8.3f}{p['build']:>8.3f}"
+                  f"{p['solve']:>8.3f}{rss:>8}{objective:>12}")
+
+    commit = git_commit()
+    output = args.output or os.path.join(RESULTS_DIR, f"{commit or 'unknown'}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({
+            'commit': commit,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'backend': args.backend,
+            'results': results,
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n结果已写入 {output}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""门框切割问题的公共模型代码
+
+流程入口（见 pipeline）可直接从包导入，首次使用时才导入对应模块：
+
+    from cutting import Material, Segment, generate_patterns, build_model, solve, report
+"""
+import importlib
+
+_LAZY = {name: 'pipeline' for name in
+         ('Material', 'Segment', 'generate_patterns', 'build_model', 'solve', 'report', 'stock_supply')}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        return getattr(importlib.import_module(f"cutting.{_LAZY[name]}"), name)
+    raise AttributeError(f"module 'cutting' has no attribute {name!r}")
@@ -0,0 +1,103 @@
+"""磁盘模式库缓存：按原料的规格化缺陷布局（core.layout_key）、锯缝和零件长度的指纹保存生成结果
+
+缺陷位置不同、各无缺陷区间长度相同的原料共用一份缓存。
+单价不参与指纹；需求只以件数上限（max_counts）的形式、且仅在上限小于原料能放下的件数时参与，
+同一批原料换一周订单时通常直接读缓存跳过 DFS。
+缓存文件为压缩 npz（计数矩阵 + 每个模式的锯缝损耗），超过容量上限时按最近使用时间淘汰。
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from cutting import core, store
+
+CACHE_DIR = '.pattern_cache'
+MAX_BYTES = 256 * 1024 * 1024
+CACHE_VERSION = 3  # 生成规则变化时递增，旧缓存自动失效
+
+
+def fingerprint(material_length, defects, segments, kerf=core.KERF, **options):
+    """options 同 store.PatternStore.add_material；件数上限先截到原料能放下的件数，不起作用的上限不影响指纹"""
+    if 'max_counts' in options:
+        options['max_counts'] = core.effective_caps(material_length, defects, segments, options['max_counts'],
+                                                    kerf, options.get('free_end_cut', False))
+        if options['max_counts'] is None:
+            del options['max_counts']
+    key = {
+        'version': CACHE_VERSION,
+        'layout': core.layout_key(material_length, defects),
+        'kerf': core.to_units(kerf),
+        'segments': [core.to_units(seg['length']) for seg in segments],
+        'options': sorted(options.items()),
+    }
+    return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+
+def _load(path):
+    with np.load(path) as data:
+        return data['counts'], data['kerf_units']
+
+
+def _save(path, counts, kerf_units):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        np.savez_compressed(f, counts=counts.astype(np.uint16), kerf_units=kerf_units.astype(np.int32))
+    os.replace(tmp, path)
+
+
+def evict(cache_dir=CACHE_DIR, max_bytes=MAX_BYTES):
+    """总大小超过上限时，从最久未使用的文件开始删除"""
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith('.npz'):
+            # 并行预热时别的进程可能刚删掉这个文件
+            try:
+                st = os.stat(os.path.join(cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, name))
+    total = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            pass
+        total -= size
+
+
+def lookup(material_length, defects, segments, kerf=core.KERF, cache_dir=CACHE_DIR, **options):
+    """命中时返回 (计数矩阵, 锯缝损耗) 并刷新最近使用时间，未命中返回 None"""
+    path = os.path.join(cache_dir, fingerprint(material_length, defects, segments, kerf, **options) + '.npz')
+    try:
+        os.utime(path)
+        return _load(path)
+    except FileNotFoundError:
+        return None
+
+
+def put(material_length, defects, segments, counts, kerf_units, kerf=core.KERF, cache_dir=CACHE_DIR,
+        max_bytes=MAX_BYTES, **options):
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, fingerprint(material_length, defects, segments, kerf, **options) + '.npz')
+    _save(path, counts, kerf_units)
+    evict(cache_dir, max_bytes)
+
+
+def cached_pattern_arrays(material_length, defects, segments, kerf=core.KERF,
+                          cache_dir=CACHE_DIR, max_bytes=MAX_BYTES, **options):
+    """返回一根原料的 (计数矩阵, 锯缝损耗) 数组，参数同 store.PatternStore.add_material；命中缓存时不再枚举"""
+    hit = lookup(material_length, defects, segments, kerf, cache_dir, **options)
+    if hit is not None:
+        return hit
+
+    patterns = store.PatternStore(segments)
+    patterns.add_material(material_length, 0, defects, kerf, **options)
+    put(material_length, defects, segments, patterns.counts, patterns.kerf_units, kerf, cache_dir, max_bytes,
+        **options)
+    return patterns.counts, patterns.kerf_units
+
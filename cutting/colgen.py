@@ -0,0 +1,109 @@
+"""列生成：只在需要时为每类原料定价生成新模式，避免全量枚举
+
+受限主问题是 LP 松弛（PuLP/CBC 求对偶价格），定价子问题在每个无缺陷区间内做有界背包；
+不再有负检验数的列时，在已生成的列上用给定后端求整数解。
+"""
+
+import numpy as np
+
+from cutting import core, instrument, model, store
+
+
+def seed_patterns(material_length, defects, segments, kerf=core.KERF):
+    """每种原料每个零件各一个同质模式，作为受限主问题的初始列"""
+    capacities = core.interval_capacities(material_length, defects)
+    seeds = []
+    for j, seg in enumerate(segments):
+        weight = core.to_units(seg['length']) + core.to_units(kerf)
+        n = sum(cap // weight for cap in capacities)
+        if n > 0:
+            counts = [0] * len(segments)
+            counts[j] = n
+            seeds.append(counts)
+    return seeds
+
+
+def price_pattern(material_length, defects, segments, duals, kerf=core.KERF):
+    """有界背包定价子问题：在每个无缺陷区间内按对偶价格装入零件，返回价值最大的切割方式"""
+    capacities = core.interval_capacities(material_length, defects)
+    weights = [core.to_units(seg['length']) + core.to_units(kerf) for seg in segments]
+    counts = [0] * len(segments)
+    best_value = 0.0
+
+    for cap in capacities:
+        # 二进制拆分把有界背包转成0-1背包，每个物品一次向量化更新
+        items = []
+        for j, (w, pi) in enumerate(zip(weights, duals)):
+            if pi <= 0 or w > cap:
+                continue
+            bound = min(segments[j]['demand'], cap // w)
+            k = 1
+            while bound > 0:
+                take = min(k, bound)
+                items.append((j, take))
+                bound -= take
+                k *= 2
+        dp = np.zeros(cap + 1)
+        keep = np.zeros((len(items), cap + 1), dtype=bool)
+        for t, (j, take) in enumerate(items):
+            w = weights[j] * take
+            candidate = dp[:cap + 1 - w] + duals[j] * take
+            better = candidate > dp[w:] + 1e-12
+            keep[t, w:] = better
+            dp[w:] = np.where(better, candidate, dp[w:])
+
+        c = int(np.argmax(dp))
+        best_value += dp[c]
+        for t in range(len(items) - 1, -1, -1):
+            if keep[t, c]:
+                j, take = items[t]
+                counts[j] += take
+                c -= weights[j] * take
+    return best_value, counts
+
+
+def solve_column_generation(groups, segments, backend, supply=None, kerf=core.KERF, max_iterations=200):
+    """groups 为 core.group_materials 合并后的原料类；supply 为各类可用根数（None 表示不限库存）。
+    返回 (PatternStore, SolveResult)，模式的原料类编号即 groups 下标
+    """
+    import pulp
+
+    all_patterns = store.PatternStore(segments)
+    seen = set()
+
+    def add_column(g_idx, counts):
+        group = groups[g_idx]
+        seen.add((g_idx, tuple(counts)))
+        all_patterns.append([counts], [core.to_units(kerf) * sum(counts)], group['length'], group['cost'], g_idx)
+
+    for g_idx, group in enumerate(groups):
+        for counts in seed_patterns(group['length'], group['defects'], segments, kerf):
+            add_column(g_idx, counts)
+
+    finite = [] if supply is None else [g for g, available in enumerate(supply) if available is not None]
+    for _ in range(max_iterations):
+        instrument.count('colgen_iterations')
+        with instrument.span('colgen_master', columns=len(all_patterns)):
+            prob, pattern_vars = model.build_pulp_model("Optimal_Cutting_CG", all_patterns, segments,
+                                                        cat=pulp.LpContinuous, supply=supply)
+            prob.solve(pulp.PULP_CBC_CMD(msg=False))
+        if prob.status != pulp.LpStatusOptimal:
+            break
+        duals = [prob.constraints[f"demand_{j}"].pi for j in range(len(segments))]
+        # 库存约束的对偶价格（<= 0），计入该类原料的检验数
+        stock_duals = {g: prob.constraints[f"supply_{k}"].pi for k, g in enumerate(finite)}
+
+        with instrument.span('colgen_pricing') as attrs:
+            added = 0
+            for g_idx, group in enumerate(groups):
+                best_value, counts = price_pattern(group['length'], group['defects'], segments, duals, kerf)
+                reduced_cost = group['cost'] - best_value - stock_duals.get(g_idx, 0)
+                if reduced_cost < -1e-6 and (g_idx, tuple(counts)) not in seen:
+                    add_column(g_idx, counts)
+                    added += 1
+            attrs['added'] = added
+        if added == 0:
+            break
+
+    # 在生成的列上求整数解
+    return all_patterns, backend.solve(all_patterns, segments, supply)
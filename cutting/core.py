@@ -0,0 +1,333 @@
+"""切割模型核心：长度、锯缝与缺陷位置在载入时统一换算为整数毫米，DFS 全程只做整数运算"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from cutting import instrument
+
+UNIT = 1000  # 1米 = 1000个整数单位（毫米）
+KERF = 0.005
+
+
+def to_units(length):
+    return int(round(length * UNIT))
+
+
+def from_units(units):
+    return units / UNIT
+
+
+def get_available_intervals(material_length, defects):
+    """返回无缺陷区间 [(start, end), ...]，单位为整数毫米；重叠缺陷会被合并"""
+    length_u = to_units(material_length)
+    spans = sorted((to_units(d['start']), to_units(d['start']) + to_units(d['length'])) for d in defects)
+    available = []
+    current_start = 0
+    for defect_start, defect_end in spans:
+        if current_start < defect_start:
+            available.append((current_start, defect_start))
+        current_start = max(current_start, defect_end)
+    if current_start < length_u:
+        available.append((current_start, length_u))
+    return available
+
+
+def interval_capacities(material_length, defects):
+    return [end - start for start, end in get_available_intervals(material_length, defects)]
+
+
+def layout_key(material_length, defects):
+    """原料的规格化缺陷布局：模式只取决于各无缺陷区间的长度，与缺陷的具体位置和顺序无关"""
+    return to_units(material_length), tuple(sorted(interval_capacities(material_length, defects)))
+
+
+def group_materials(materials):
+    """把长度、单价、规格化缺陷布局都相同的原料合并为一类，'count' 记录该类的根数；
+    原料带 'stock'（库存根数，None 为不限）时同类相加，任一根不限则整类不限
+    """
+    groups = {}
+    for mat in materials:
+        key = layout_key(mat['length'], mat['defects']) + (mat['cost'],)
+        if key in groups:
+            group = groups[key]
+            group['count'] += 1
+            if 'stock' in group:
+                stock = mat.get('stock')
+                group['stock'] = None if group['stock'] is None or stock is None else group['stock'] + stock
+        else:
+            groups[key] = dict(mat, count=1)
+    return list(groups.values())
+
+
+def make_pattern(material_length, material_cost, segments, counts, kerf_units):
+    """由各零件数量构造模式字典，所有长度先在整数上求和再换算回米"""
+    used_u = sum(to_units(seg['length']) * n for seg, n in zip(segments, counts))
+    length_u = to_units(material_length)
+    return {
+        'material_length': material_length,
+        'cost': material_cost,
+        'pattern': {seg['name']: n for seg, n in zip(segments, counts) if n > 0},
+        'total_used': from_units(used_u + kerf_units),
+        'waste': from_units(length_u - used_u - kerf_units),
+        'kerf_loss': from_units(kerf_units)
+    }
+
+
+def effective_caps(material_length, defects, segments, max_counts, kerf=KERF, free_end_cut=False):
+    """把每种零件的件数上限截到一根原料最多能放下的件数；没有上限或上限都不起作用时返回 None"""
+    if max_counts is None:
+        return None
+    capacities = interval_capacities(material_length, defects)
+    kerf_u = to_units(kerf)
+    extra = kerf_u if free_end_cut else 0
+    fit = [sum((cap + extra) // (to_units(seg['length']) + kerf_u) for cap in capacities) for seg in segments]
+    caps = [min(int(n), f) for n, f in zip(max_counts, fit)]
+    return None if caps == fit else caps
+
+
+@lru_cache(maxsize=8)
+def fit_table(seg_units, kerf_u, max_remaining, free_end_cut=False):
+    """可放零件查找表：table[r][i] 为剩余 r 毫米时、下标不小于 i 的零件中第一个还能放下的零件下标，都放不下时为零件数
+
+    DFS 由此一步跳过放不下的零件，table[r][0] 等于零件数即该区间已放满。
+    seg_units 为元组；按原料长度建表，同长度的原料共用，只缓存最近几张表
+    """
+    units = np.array(seg_units, dtype=np.int64)
+    remaining = np.arange(max_remaining + 1)[:, None]
+    fits = units + kerf_u <= remaining
+    if free_end_cut:
+        fits |= units == remaining
+    n = len(seg_units)
+    first = np.full((max_remaining + 1, n + 1), n, dtype=np.int64)
+    for i in range(n - 1, -1, -1):
+        first[:, i] = np.where(fits[:, i], i, first[:, i + 1])
+    return first.tolist()
+
+
+def undominated(vectors, chunk_size=1 << 22):
+    """返回未被支配的行下标（升序）：若另一行各分量都不小于它，则该行被支配
+
+    支配者的分量和一定更大（或与它完全相同），按分量和从大到小分块，
+    每块一次性与已保留的行比较；chunk_size 限制比较时临时数组的元素数
+    """
+    vectors = np.asarray(vectors)
+    if not len(vectors):
+        return np.zeros(0, dtype=np.intp)
+    sums = vectors.sum(axis=1, dtype=np.int64)
+    order = np.argsort(-sums, kind='stable')
+    kept = np.empty(len(vectors), dtype=np.intp)
+    n_kept = 0
+    for block in np.split(order, np.flatnonzero(np.diff(sums[order])) + 1):
+        # 分量和相同的行只有完全相同时才互相支配，保留最先出现的一行
+        _, first = np.unique(vectors[block], axis=0, return_index=True)
+        block = block[np.sort(first)]
+        if n_kept:
+            kept_rows = vectors[kept[:n_kept]]
+            step = max(1, chunk_size // kept_rows.size)
+            dominated = np.concatenate([(kept_rows >= vectors[block[i:i + step], None]).all(axis=2).any(axis=1)
+                                        for i in range(0, len(block), step)])
+            block = block[~dominated]
+        kept[n_kept:n_kept + len(block)] = block
+        n_kept += len(block)
+    return np.sort(kept[:n_kept])
+
+
+def iter_patterns(material_length, defects, segments, kerf=KERF,
+                  include_empty=False, free_end_cut=False, maximal_only=False, max_counts=None, first_choice=None):
+    """逐个产出一根原料上可行的切割方式 (各零件数量元组, 锯缝损耗整数毫米)，不构造模式字典
+
+    参数含义同 store.PatternStore.add_material；maximal_only 在这里只筛极大模式，
+    支配过滤需要看到全部模式，由调用方在结果上进行。
+    同一组合有多种区间分配时，锯缝损耗取各分配中最小的；只有 free_end_cut 时各分配的锯缝才可能不同，
+    此时各组合记下最小锯缝，枚举结束后按首次找到的顺序一并产出
+
+    first_choice: 只展开根节点的一个分支，即第一个区间里下标最小的零件（等于零件数时表示第一个区间不放零件），
+        各分支的结果合起来（去重后）就是全部模式，用于把一根大原料拆给多个进程
+    """
+    capacities = interval_capacities(material_length, defects)
+    seg_units = [to_units(seg['length']) for seg in segments]
+    kerf_u = to_units(kerf)
+    needs = [u + kerf_u for u in seg_units]
+    caps = effective_caps(material_length, defects, segments, max_counts, kerf, free_end_cut)
+
+    def is_maximal_capped(remaining, counts):
+        # 已达上限的零件不再算作“还能放下”
+        open_units = [u for u, n, cap in zip(seg_units, counts, caps) if n < cap]
+        need = min(open_units, default=float('inf')) + kerf_u
+        exact = set(open_units) if free_end_cut else set()
+        return all(r < need and r not in exact for r in remaining)
+
+    n_segments = len(segments)
+    last = len(capacities) - 1
+    counts = [0] * n_segments
+    if last < 0:
+        if include_empty:
+            yield tuple(counts), 0
+        return
+    fits = fit_table(tuple(seg_units), kerf_u, to_units(material_length), free_end_cut)
+
+    # 零件组合按混合进制编码成一个整数，同一组合只输出一次（不同区间分配可得到同一组合）
+    radix = [1] * n_segments
+    for j in range(1, n_segments):
+        radix[j] = radix[j - 1] * (sum(cap // seg_units[j - 1] for cap in capacities) + 1)
+    emitted = set()
+    best_kerf = {}  # free_end_cut 时：组合编码 -> [计数元组, 最小锯缝]
+    # 只要极大模式且没有件数上限时，一个区间放到再也放不下零件才转到下一个区间
+    close_only_full = maximal_only and caps is None
+
+    # 显式栈上的 DFS，按区间逐个装填，同一区间内零件下标不减；counts/remaining 原地加减，回溯时撤销。
+    # frames 中每帧为 [当前区间, 下一个尝试的零件]，零件下标等于零件数时表示转到下一个区间，再大表示已尝试完；
+    # moves[d] 为进入第 d+1 层时放下的 (零件, 区间, 占用长度, 锯缝)，转区间时为 None
+    remaining = list(capacities)
+    code = 0
+    pieces = 0
+    kerf_total = 0
+    frames = [[0, 0 if first_choice is None else first_choice]]
+    moves = []
+    # 根节点（空组合）归到“第一个区间不放零件”的分支
+    enter_last = last == 0 and first_choice in (None, n_segments)
+    # 埋点计数：搜索节点数、因件数上限跳过的零件数、不是极大模式而被舍弃的叶子数
+    nodes = cap_pruned = rejected = 0
+
+    while True:
+        # 进入了最后一个区间上的节点：每种切割方式都会在这里出现
+        if enter_last and (include_empty or pieces) and (free_end_cut or code not in emitted):
+            # 没有上限时前面的区间在转出时已放满，只需检查最后一个区间
+            if not maximal_only or (is_maximal_capped(remaining, counts) if caps is not None else
+                                    fits[remaining[last]][0] == n_segments):
+                if not free_end_cut:
+                    emitted.add(code)
+                    yield tuple(counts), kerf_total
+                elif code not in best_kerf:
+                    best_kerf[code] = [tuple(counts), kerf_total]
+                elif kerf_total < best_kerf[code][1]:
+                    best_kerf[code][1] = kerf_total
+            else:
+                rejected += 1
+        enter_last = False
+
+        if not frames:
+            for row, k in best_kerf.values():
+                yield row, k
+            break
+        frame = frames[-1]
+        k, i = frame
+        r = remaining[k]
+        move = None
+        if i < n_segments:
+            row = fits[r]
+            i = row[i]
+            while caps is not None and i < n_segments and counts[i] >= caps[i]:
+                cap_pruned += 1
+                i = row[i + 1]
+            if i < n_segments:
+                # 查找表里放得下的零件，要么加锯缝也放得下，要么恰好切到区间末端
+                move = (i, k, needs[i], kerf_u) if needs[i] <= r else (i, k, r, 0)
+        if first_choice is not None and len(frames) == 1 and i != first_choice:
+            move = None
+            i = n_segments + 1
+
+        if move is not None:
+            # 限定了根分支时，根节点只走这一步
+            frame[1] = n_segments + 1 if first_choice is not None and len(frames) == 1 else i + 1
+            remaining[k] -= move[2]
+            counts[i] += 1
+            code += radix[i]
+            pieces += 1
+            kerf_total += move[3]
+            frames.append([k, i])
+            moves.append(move)
+            nodes += 1
+            enter_last = k == last
+        elif i == n_segments and k < last and (not close_only_full or fits[r][0] == n_segments):
+            frame[1] = n_segments + 1
+            frames.append([k + 1, 0])
+            moves.append(None)
+            nodes += 1
+            enter_last = k + 1 == last
+        else:
+            # 本层分支都已尝试，撤销进入本层时的操作
+            frames.pop()
+            if moves:
+                move = moves.pop()
+                if move is not None:
+                    j, interval_idx, used, cut = move
+                    counts[j] -= 1
+                    remaining[interval_idx] += used
+                    code -= radix[j]
+                    pieces -= 1
+                    kerf_total -= cut
+
+    if instrument.enabled():
+        instrument.count('dfs_nodes', nodes)
+        instrument.count('dfs_cap_pruned', cap_pruned)
+        instrument.count('dfs_non_maximal', rejected)
+        instrument.count('dfs_emitted', len(best_kerf) if free_end_cut else len(emitted))
+
+
+def iter_pattern_batches(material_length, defects, segments, kerf=KERF, batch_size=4096, **options):
+    """按固定批量产出 (counts, kerf_units)：uint16 计数矩阵（批量 × 零件数）与 int32 锯缝损耗。
+
+    两个数组是复用的缓冲区，下一批产出前会被覆盖，调用方需要自行拷贝
+    """
+    counts = np.empty((batch_size, len(segments)), dtype=np.uint16)
+    kerf_units = np.empty(batch_size, dtype=np.int32)
+    n = 0
+    for row, k in iter_patterns(material_length, defects, segments, kerf, **options):
+        counts[n] = row
+        kerf_units[n] = k
+        n += 1
+        if n == batch_size:
+            yield counts, kerf_units
+            n = 0
+    if n:
+        yield counts[:n], kerf_units[:n]
+
+
+def knapsack_patterns(capacity, segments, kerf=KERF, include_empty=False, free_end_cut=False,
+                      maximal_only=False, max_counts=None):
+    """单个无缺陷区间（如问题1的整根原料）的模式枚举，不走 DFS：
+
+    按零件逐个展开有界背包的格点，每步把所有部分计数向量按剩余长度能放下的件数整体复制，
+    直接得到计数矩阵。capacity 为区间长度（整数毫米），其余参数同 store.PatternStore.add_material；
+    max_counts 为每种零件在一个模式中的件数上限（如订单需求），None 只受长度限制。
+    返回 (counts, kerf_units)，格式同 iter_pattern_batches
+    """
+    seg_units = np.array([to_units(seg['length']) for seg in segments], dtype=np.int64)
+    kerf_u = to_units(kerf)
+    need = seg_units + kerf_u
+    # 末件恰好切到区间末端时不计锯缝，相当于区间多出一个锯缝的长度
+    bound = capacity + (kerf_u if free_end_cut else 0)
+    caps = bound // need
+    if max_counts is not None:
+        caps = np.minimum(caps, max_counts)
+
+    counts = np.zeros((1, len(segments)), dtype=np.int64)
+    weight = np.zeros(1, dtype=np.int64)
+    for j in np.flatnonzero(caps):
+        reps = np.minimum((bound - weight) // need[j], caps[j]) + 1
+        parent = np.repeat(np.arange(len(weight)), reps)
+        take = np.arange(reps.sum()) - np.repeat(np.cumsum(reps) - reps, reps)
+        counts = counts[parent]
+        counts[:, j] = take
+        weight = weight[parent] + take * need[j]
+
+    pieces = counts.sum(axis=1)
+    normal = weight <= capacity
+    exact = (weight - kerf_u == capacity) & (pieces > 0) if free_end_cut else np.zeros_like(normal)
+    keep = normal | exact
+    if not include_empty:
+        keep &= pieces > 0
+    if maximal_only:
+        remaining = np.where(normal, capacity - weight, 0)
+        fits = need <= remaining[:, None]
+        if free_end_cut:
+            fits |= seg_units == remaining[:, None]
+        if max_counts is not None:
+            fits &= counts < np.asarray(max_counts)
+        keep &= ~fits.any(axis=1)
+
+    kerf_units = np.where(normal, pieces, pieces - 1) * kerf_u
+    return counts[keep].astype(np.uint16), kerf_units[keep].astype(np.int32)
+
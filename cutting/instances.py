@@ -0,0 +1,65 @@
+"""随附的三个算例：问题1/2/3 的订单与原料，供各问题脚本与基准共用
+
+零件字典另带 'price'，为该订单每樘窗的售价；每樘窗需要两根宽、两根高，demand 按根计。
+"""
+
+import os
+from dataclasses import dataclass, field
+
+from cutting import stock
+
+WORKBOOK = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '附件.xlsx')
+PRICES = [480, 680, 550, 420]  # 订单1~4 每樘窗的售价（元）
+
+
+@dataclass
+class Instance:
+    name: str
+    segments: list
+    materials: list  # 原料字典列表，格式同 stock.load_materials
+    options: dict = field(default_factory=dict)  # 生成模式的选项，同 store.PatternStore.add_material
+
+    @property
+    def max_counts(self):
+        """模式中每种零件的件数不超过需求"""
+        return [seg['demand'] for seg in self.segments]
+
+
+def order_segments(widths, heights, windows):
+    """按订单构造零件：每个订单一宽一高两种零件，windows 为各订单的窗数"""
+    segments = []
+    for k, (width, height, n, price) in enumerate(zip(widths, heights, windows, PRICES), start=1):
+        segments.append({'name': f"order{k}_width", 'length': width, 'demand': n * 2, 'price': price})
+        segments.append({'name': f"order{k}_height", 'length': height, 'demand': n * 2, 'price': price})
+    return segments
+
+
+def question_1():
+    """无缺陷原料；零件恰好切到原料末端时不需要锯缝"""
+    segments = order_segments([1.59, 1.79, 1.69, 1.49], [2.19, 2.39, 2.29, 1.99], [10, 20, 20, 15])
+    materials = [
+        {'length': 5.5, 'cost': 18, 'defects': []},
+        {'length': 6.2, 'cost': 22, 'defects': []},
+        {'length': 7.8, 'cost': 28, 'defects': []},
+    ]
+    return Instance('q1', segments, materials, {'free_end_cut': True, 'maximal_only': True})
+
+
+def question_2():
+    """带缺陷的三种原料"""
+    segments = order_segments([1.61, 1.81, 1.71, 1.51], [2.21, 2.41, 2.31, 2.01], [10, 20, 20, 15])
+    materials = [
+        {'length': 5.5, 'cost': 18, 'defects': [{'start': 1.0, 'length': 0.03}, {'start': 2.5, 'length': 0.04}]},
+        {'length': 6.2, 'cost': 22, 'defects': [{'start': 0.5, 'length': 0.02}, {'start': 1.8, 'length': 0.05}]},
+        {'length': 7.8, 'cost': 28, 'defects': [{'start': 3.0, 'length': 0.03}]},
+    ]
+    return Instance('q2', segments, materials, {'include_empty': True, 'maximal_only': True})
+
+
+def question_3(path=WORKBOOK, sheet_name='Sheet1'):
+    """附件.xlsx 中的带缺陷原料"""
+    segments = order_segments([1.59, 1.79, 1.69, 1.49], [2.19, 2.39, 2.29, 1.99], [120, 80, 60, 40])
+    return Instance('q3', segments, stock.load_materials(path, sheet_name=sheet_name), {'maximal_only': True})
+
+
+SHIPPED = {'q1': question_1, 'q2': question_2, 'q3': question_3}
@@ -0,0 +1,137 @@
+"""流水线埋点：分阶段计时、计数器和求解器统计，默认关闭
+
+库内各阶段调用 span()/count()；没有 recording() 时 span 返回空的上下文管理器、count 直接返回，
+开销只有一次全局变量判断。recording(profile_path) 打开记录，给出路径时同时用 cProfile 采样并写出
+.prof 文件（可用 snakeviz、pstats 查看）。子进程里生成模式时记录不回传，只有主进程内的阶段会被记下。
+
+    with instrument.recording('run.prof') as rec:
+        main()
+    print(rec.summary())
+    rec.to_json('run.json')
+
+命令行脚本用 add_arguments 加上 --metrics/--profile，再用 session 包住主函数。
+"""
+
+import cProfile
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+_active = None
+
+
+class _NullSpan:
+    def __enter__(self):
+        return {}
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Recorder:
+    def __init__(self):
+        self.spans = []  # 按结束顺序：{'name', 'path', 'seconds', 其余属性}
+        self.counters = defaultdict(int)
+        self._stack = []
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """计时一个阶段；with 得到的字典可补充属性（如求解器统计），嵌套的阶段以 'a/b' 路径记下"""
+        self._stack.append(name)
+        path = '/'.join(self._stack)
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            self._stack.pop()
+            self.spans.append({'name': name, 'path': path, 'seconds': time.perf_counter() - start, **attrs})
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def totals(self):
+        """各路径的 (次数, 总秒数)，按路径排序，子阶段紧跟在父阶段之后"""
+        totals = {}
+        for s in self.spans:
+            calls, seconds = totals.get(s['path'], (0, 0.0))
+            totals[s['path']] = (calls + 1, seconds + s['seconds'])
+        return dict(sorted(totals.items(), key=lambda item: item[0]))
+
+    def as_dict(self):
+        return {'spans': self.spans, 'counters': dict(self.counters)}
+
+    def to_json(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.as_dict(), f, ensure_ascii=False, indent=2, default=float)
+
+    def log(self, logger=None, level=logging.INFO):
+        """每个阶段、计数器各输出一条 JSON 结构化日志"""
+        logger = logger or logging.getLogger('cutting')
+        for s in self.spans:
+            logger.log(level, json.dumps({'event': 'span', **s}, ensure_ascii=False, default=float))
+        for name, n in self.counters.items():
+            logger.log(level, json.dumps({'event': 'counter', 'name': name, 'value': n}, ensure_ascii=False))
+
+    def summary(self):
+        lines = [f"{'阶段':<36}{'次数':>8}{'耗时(s)':>12}"]
+        for path, (calls, seconds) in self.totals().items():
+            lines.append(f"{path:<36}{calls:>8}{seconds:>12.4f}")
+        for name, n in self.counters.items():
+            lines.append(f"{name:<36}{n:>20}")
+        return '\n'.join(lines)
+
+
+def enabled():
+    return _active is not None
+
+
+def span(name, **attrs):
+    if _active is None:
+        return _NULL_SPAN
+    return _active.span(name, **attrs)
+
+
+def count(name, n=1):
+    if _active is not None:
+        _active.counters[name] += n
+
+
+@contextmanager
+def recording(profile_path=None):
+    """打开记录，返回 Recorder；profile_path 不为空时同时运行 cProfile 并在结束时写出"""
+    global _active
+    previous, recorder = _active, Recorder()
+    _active = recorder
+    profiler = cProfile.Profile() if profile_path else None
+    if profiler is not None:
+        profiler.enable()
+    try:
+        yield recorder
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(profile_path)
+        _active = previous
+
+
+def add_arguments(parser):
+    parser.add_argument('--metrics', default=None, help='把各阶段耗时、计数器和求解器统计写入此 JSON 文件')
+    parser.add_argument('--profile', default=None, help='用 cProfile 采样并写出 .prof 文件')
+
+
+@contextmanager
+def session(metrics_path=None, profile_path=None):
+    """两个路径都为空时不记录，返回 None；否则记录，结束后打印汇总并按需写出 JSON"""
+    if not (metrics_path or profile_path):
+        yield None
+        return
+    with recording(profile_path) as recorder:
+        yield recorder
+    print(f"\n{recorder.summary()}")
+    if metrics_path:
+        recorder.to_json(metrics_path)
@@ -0,0 +1,64 @@
+"""求解后的汇总指标：解向量与模式库的列做点积，一次算出利用率、损耗率和各零件的完成情况"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class SolutionMetrics:
+    x: np.ndarray  # 各模式使用次数
+    total_cost: float
+    total_material: float  # 所用原料总长（米）
+    total_waste: float  # 余料总长，不含锯缝
+    total_kerf: float
+    utilization: float  # (原料 - 余料) / 原料
+    loss_rate: float  # (余料 + 锯缝) / 原料
+    demand: np.ndarray
+    produced: np.ndarray  # 各零件实际产出
+    revenue: float = None
+    profit: float = None
+
+    @property
+    def shortfall(self):
+        """各零件缺口，可行解全为 0"""
+        return np.maximum(self.demand - self.produced, 0)
+
+    @property
+    def overproduction(self):
+        return np.maximum(self.produced - self.demand, 0)
+
+    @property
+    def fulfilled(self):
+        return not self.shortfall.any()
+
+    def used_patterns(self):
+        """使用次数大于 0 的模式下标"""
+        return np.flatnonzero(self.x > 0)
+
+
+def order_revenue(segments):
+    """按订单计的销售额：每樘窗两根宽、两根高，seg['price'] 为该订单每樘窗的售价"""
+    return sum(seg['demand'] // 2 * seg['price'] for seg in segments) / 2
+
+
+def compute_metrics(patterns, segments, x, revenue=None):
+    """patterns 为 PatternStore，x 为解向量（如 SolveResult.x）；给出 revenue 时一并计算利润"""
+    x = np.asarray(x, dtype=float)
+    total_cost = float(x @ patterns.cost)
+    total_material = float(x @ patterns.material_length)
+    total_waste = float(x @ patterns.waste)
+    total_kerf = float(x @ patterns.kerf_loss)
+    return SolutionMetrics(
+        x=x,
+        total_cost=total_cost,
+        total_material=total_material,
+        total_waste=total_waste,
+        total_kerf=total_kerf,
+        utilization=(total_material - total_waste) / total_material if total_material else 0.0,
+        loss_rate=(total_waste + total_kerf) / total_material if total_material else 0.0,
+        demand=np.array([seg['demand'] for seg in segments], dtype=float),
+        produced=x @ patterns.counts,
+        revenue=revenue,
+        profit=None if revenue is None else revenue - total_cost,
+    )
@@ -0,0 +1,62 @@
+"""模型构建：模式以稀疏计数矩阵（模式 × 零件）保存，只把非零系数交给求解器
+
+PuLP 只在 build_pulp_model 里导入，只用 scipy 后端时不加载。
+"""
+
+import numpy as np
+from scipy import sparse
+
+from cutting import instrument
+
+
+def pattern_matrix(patterns):
+    """返回 PatternStore 的 CSR 计数矩阵，第 i 行为模式 i 中各零件的数量"""
+    return sparse.csr_matrix(patterns.counts, dtype=np.int64)
+
+
+def supply_matrix(patterns, supply):
+    """库存约束：supply[g] 为第 g 类原料的可用根数（None 表示不限）。
+
+    返回 (矩阵, 上限)，矩阵第 k 行对应一类有限库存原料，模式所属原料类见 PatternStore.group
+    """
+    finite = [g for g, available in enumerate(supply) if available is not None]
+    row_of = np.full(len(supply) + 1, -1)  # 末位对应 group=-1
+    row_of[finite] = np.arange(len(finite))
+    groups = patterns.group
+    rows = row_of[np.where((groups >= 0) & (groups < len(supply)), groups, -1)]
+    cols = np.flatnonzero(rows >= 0)
+    matrix = sparse.csr_matrix((np.ones(len(cols)), (rows[cols], cols)), shape=(len(finite), len(patterns)))
+    return matrix, np.array([supply[g] for g in finite], dtype=float)
+
+
+def build_pulp_model(name, patterns, segments, cat='Integer', supply=None):
+    """按列存储的矩阵逐零件取出非零项，直接构造 PuLP 约束。
+    需求约束按零件序号命名为 demand_{j}、库存约束为 supply_{k}，便于读取对偶价格和修改右端；
+    PuLP 会改写名字里的空格和 '-'，零件名不能直接作约束名。
+    cat 为 PuLP 的变量类型（pulp.LpInteger 即 'Integer'，LP 松弛用 pulp.LpContinuous）
+    """
+    with instrument.span('build_model', patterns=len(patterns)):
+        return _build_pulp_model(name, patterns, segments, cat, supply)
+
+
+def _build_pulp_model(name, patterns, segments, cat, supply):
+    from pulp import LpProblem, LpMinimize, LpVariable, LpAffineExpression
+
+    counts = pattern_matrix(patterns).tocsc()
+    prob = LpProblem(name, LpMinimize)
+    pattern_vars = [LpVariable(f"Pattern_{i}", lowBound=0, cat=cat) for i in range(len(patterns))]
+    prob += LpAffineExpression(zip(pattern_vars, patterns.cost.tolist()))
+
+    for j, seg in enumerate(segments):
+        lo, hi = counts.indptr[j], counts.indptr[j + 1]
+        seg_total = LpAffineExpression(
+            (pattern_vars[i], int(n)) for i, n in zip(counts.indices[lo:hi], counts.data[lo:hi])
+        )
+        prob += seg_total >= seg['demand'], f"demand_{j}"
+
+    if supply is not None:
+        stock, available = supply_matrix(patterns, supply)
+        for k, upper in enumerate(available):
+            lo, hi = stock.indptr[k], stock.indptr[k + 1]
+            prob += LpAffineExpression((pattern_vars[i], 1) for i in stock.indices[lo:hi]) <= upper, f"supply_{k}"
+    return prob, pattern_vars
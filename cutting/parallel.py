@@ -0,0 +1,166 @@
+"""多进程模式生成：每类原料一个任务，区间多、能放下的件数多的大原料再按 DFS 根节点分支拆成多个任务
+
+子进程把计数矩阵和锯缝损耗写进共享内存，只把共享内存块的名字传回主进程，
+主进程拷入 PatternStore 后释放，不经 pickle 传递模式。
+"""
+
+import math
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from cutting import cache, core, instrument, store
+
+SPLIT_PIECES = 8  # 有多个区间且一根最多能放下的件数达到此值时，按根节点分支拆分
+MIN_PARALLEL_WORK = 100000  # 估计的搜索节点总数不到此值时在本进程内生成，启动进程池反而更慢
+
+
+def _estimated_work(pieces, n_segments):
+    """一根原料的搜索规模粗估：最多 pieces 件、n_segments 种零件的组合数"""
+    return math.comb(pieces + n_segments, n_segments)
+
+
+def _run_task(task):
+    material_length, defects, segments, kerf, first_choice, options = task
+    with instrument.span('material', length=material_length, defects=len(defects), branch=first_choice) as attrs:
+        counts, kerf_units = _generate(material_length, defects, segments, kerf, first_choice, options)
+        attrs['patterns'] = len(kerf_units)
+    return counts, kerf_units
+
+
+def _generate(material_length, defects, segments, kerf, first_choice, options):
+    if first_choice is None:
+        patterns = store.PatternStore(segments)
+        patterns.add_material(material_length, 0, defects, kerf, **options)
+        return patterns.counts, patterns.kerf_units
+
+    # 批缓冲区会被复用，逐批拷贝
+    batches = [(counts.copy(), kerf_units.copy()) for counts, kerf_units in
+               core.iter_pattern_batches(material_length, defects, segments, kerf, first_choice=first_choice,
+                                         **options)]
+    counts = np.concatenate([b[0] for b in batches]) if batches else np.zeros((0, len(segments)), np.uint16)
+    kerf_units = np.concatenate([b[1] for b in batches]) if batches else np.zeros(0, np.int32)
+    if options.get('maximal_only') and len(counts):
+        # 分支内被支配的模式在全体中也被支配，先筛掉以减少回传
+        kept = core.undominated(counts)
+        counts, kerf_units = counts[kept], kerf_units[kept]
+    return counts, kerf_units
+
+
+def _generate_task(task):
+    """在子进程中运行，返回 (共享内存名, 行数)；共享内存由主进程释放"""
+    counts, kerf_units = _run_task(task)
+    counts = counts.astype(np.uint16, copy=False)
+    shm = shared_memory.SharedMemory(create=True, size=max(counts.nbytes + len(kerf_units) * 4, 1))
+    np.ndarray(counts.shape, dtype=np.uint16, buffer=shm.buf)[:] = counts
+    np.ndarray(len(kerf_units), dtype=np.int32, buffer=shm.buf, offset=counts.nbytes)[:] = kerf_units
+    shm.close()
+    return shm.name, len(kerf_units)
+
+
+def _read_shared(name, n, n_segments):
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        counts = np.ndarray((n, n_segments), dtype=np.uint16, buffer=shm.buf).copy()
+        kerf_units = np.ndarray(n, dtype=np.int32, buffer=shm.buf, offset=counts.nbytes).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+    return counts, kerf_units
+
+
+def _release(name):
+    """释放一块还没被读取的共享内存，已释放的忽略"""
+    try:
+        shm = shared_memory.SharedMemory(name=name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    shm.unlink()
+
+
+def _run_pool(tasks, workers, n_segments):
+    # 先在主进程启动资源跟踪器，子进程共用它：子进程退出时不会清理交给主进程的共享内存，
+    # 主进程异常退出时则由它回收
+    resource_tracker.ensure_running()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_generate_task, task) for task in tasks]
+        try:
+            return [_read_shared(*future.result(), n_segments) for future in futures]
+        except BaseException:
+            # 某个任务出错时，其余任务可能已写好共享内存，等它们结束后逐个释放
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            for future in futures:
+                if not future.cancelled() and future.exception() is None:
+                    _release(future.result()[0])
+            raise
+
+
+def _merge(parts, maximal_only):
+    """合并同一原料各分支的结果：重复的组合只留一行，按最先出现的顺序排列、锯缝取最小；极大模式再做支配过滤"""
+    counts = np.concatenate([p[0] for p in parts])
+    kerf_units = np.concatenate([p[1] for p in parts])
+    _, first, inverse = np.unique(counts, axis=0, return_index=True, return_inverse=True)
+    min_kerf = np.full(len(first), np.iinfo(np.int32).max, dtype=np.int32)
+    np.minimum.at(min_kerf, inverse.ravel(), kerf_units)
+    order = np.argsort(first)
+    counts, kerf_units = counts[first[order]], min_kerf[order]
+    if maximal_only and len(counts):
+        kept = core.undominated(counts)
+        counts, kerf_units = counts[kept], kerf_units[kept]
+    return counts, kerf_units
+
+
+def generate_store(groups, segments, kerf=core.KERF, workers=None, use_cache=True, cache_dir=cache.CACHE_DIR,
+                   split_pieces=SPLIT_PIECES, **options):
+    """为 core.group_materials 得到的每类原料生成模式，返回 PatternStore（原料类编号即 groups 下标）
+
+    options 同 store.PatternStore.add_material；workers 为进程数上限，默认为 CPU 核数，
+    为 1 或估计的搜索规模不到 MIN_PARALLEL_WORK 时在本进程内顺序生成。
+    use_cache 时先查磁盘缓存，只为未命中的原料类分派任务，生成结果再写回缓存
+    """
+    workers = workers or os.cpu_count()
+    results = [None] * len(groups)
+    tasks, owners = [], []
+    work = 0
+    for g, group in enumerate(groups):
+        if use_cache:
+            results[g] = cache.lookup(group['length'], group['defects'], segments, kerf, cache_dir, **options)
+            if results[g] is not None:
+                continue
+        capacities = core.interval_capacities(group['length'], group['defects'])
+        min_need = min(core.to_units(seg['length']) for seg in segments) + core.to_units(kerf)
+        pieces = sum(cap // min_need for cap in capacities)
+        work += _estimated_work(pieces, len(segments))
+        if len(capacities) > 1 and pieces >= split_pieces:
+            choices = range(len(segments) + 1)
+        else:
+            choices = [None]
+        for first_choice in choices:
+            tasks.append((group['length'], group['defects'], segments, kerf, first_choice, options))
+            owners.append(g)
+
+    if use_cache:
+        instrument.count('cache_hits', len(groups) - len(set(owners)))
+    if tasks:
+        parts = defaultdict(list)
+        inline = workers == 1 or len(tasks) == 1 or work < MIN_PARALLEL_WORK
+        with instrument.span('generate', tasks=len(tasks), workers=1 if inline else workers):
+            outputs = map(_run_task, tasks) if inline else _run_pool(tasks, workers, len(segments))
+            for g, output in zip(owners, outputs):
+                parts[g].append(output)
+        for g, group_parts in parts.items():
+            results[g] = group_parts[0] if len(group_parts) == 1 else _merge(group_parts, options.get('maximal_only'))
+            if use_cache:
+                group = groups[g]
+                cache.put(group['length'], group['defects'], segments, *results[g], kerf, cache_dir, **options)
+
+    patterns = store.PatternStore(segments)
+    for g, group in enumerate(groups):
+        patterns.append(*results[g], group['length'], group['cost'], g)
+    return patterns
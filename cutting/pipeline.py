@@ -0,0 +1,115 @@
+"""从原料和订单到切割方案的完整流程：生成模式 → 建模 → 求解 → 报告
+
+零件和原料可以用 Segment/Material，也可以直接用库内通用的字典（见 instances），两者可混用。
+无缺陷原料就是 defects 为空、只有一个整段区间的原料，与带缺陷原料走同一套模式生成。
+包级的 cutting.generate_patterns 等名字按需导入本模块；PuLP 只在 build_model 或用 CBC 求解时加载。
+
+    import cutting
+    segments = [cutting.Segment('w', 1.59, 20), cutting.Segment('h', 2.19, 20)]
+    materials = [cutting.Material(6.2, 22), cutting.Material(5.5, 18, defects=[(1.0, 0.03)])]
+    patterns = cutting.generate_patterns(materials, segments, maximal_only=True)
+    result = cutting.solve(patterns, segments)
+    cutting.report(patterns, segments, result)
+"""
+
+from dataclasses import dataclass
+
+from cutting import core, instrument, metrics, parallel, solvers
+
+
+@dataclass(frozen=True)
+class Segment:
+    name: str
+    length: float  # 米
+    demand: int  # 根
+    price: float = 0  # 所属订单每樘窗的售价，只用于 metrics.order_revenue
+
+    def as_dict(self):
+        return {'name': self.name, 'length': self.length, 'demand': self.demand, 'price': self.price}
+
+
+@dataclass(frozen=True)
+class Material:
+    length: float  # 米
+    cost: float
+    defects: tuple = ()  # ((起点, 长度), ...) 或缺陷字典，米；为空即无缺陷原料
+    id: object = None
+    stock: int = None  # 库存根数，None 为不限，见 core.group_materials
+
+    def as_dict(self):
+        mat = {'length': self.length, 'cost': self.cost,
+               'defects': [d if isinstance(d, dict) else {'start': d[0], 'length': d[1]} for d in self.defects],
+               'stock': self.stock}
+        if self.id is not None:
+            mat['id'] = self.id
+        return mat
+
+
+def as_dicts(items):
+    """Segment/Material 转为字典，字典原样保留"""
+    return [item if isinstance(item, dict) else item.as_dict() for item in items]
+
+
+def stock_supply(materials):
+    """各原料类的可用根数，顺序与 generate_patterns 的原料类编号一致，用作 solve 的 supply。
+    Material 取 stock 之和（None 为不限）；不带 'stock' 的原料字典每个算一根
+    """
+    return [group.get('stock', group['count']) for group in core.group_materials(as_dicts(materials))]
+
+
+def generate_patterns(materials, segments, kerf=core.KERF, workers=None, use_cache=True, cap_to_demand=True,
+                      **options):
+    """合并同类原料后生成模式，返回 PatternStore（原料类编号见 stock_supply）。
+
+    options 同 store.PatternStore.add_material；cap_to_demand 时每种零件在一个模式中的件数不超过其需求。
+    workers、use_cache 同 parallel.generate_store
+    """
+    segments = as_dicts(segments)
+    if cap_to_demand:
+        options.setdefault('max_counts', [seg['demand'] for seg in segments])
+    return parallel.generate_store(core.group_materials(as_dicts(materials)), segments, kerf=kerf,
+                                   workers=workers, use_cache=use_cache, **options)
+
+
+def build_model(patterns, segments, relax=False, supply=None, name="Optimal_Cutting"):
+    """返回 (PuLP 问题, 各模式的变量)；relax 时变量取连续值（LP 松弛）"""
+    from cutting import model
+
+    return model.build_pulp_model(name, patterns, as_dicts(segments), cat='Continuous' if relax else 'Integer',
+                                  supply=supply)
+
+
+def solve(patterns, segments, backend=None, supply=None, **options):
+    """用指定后端求解，默认按模式数选择（见 solvers.select_backend）；options 为 threads、time_limit、mip_gap 等"""
+    backend = backend or solvers.select_backend(len(patterns), options.get('time_limit'))
+    return solvers.get_backend(backend, **options).solve(patterns, as_dicts(segments), supply)
+
+
+def report(patterns, segments, result, revenue=None, file=None):
+    """打印成本、利用率、所用模式和需求完成情况，返回 metrics.SolutionMetrics；给出 revenue 时一并打印利润"""
+    with instrument.span('report'):
+        return _report(patterns, as_dicts(segments), result, revenue, file)
+
+
+def _report(patterns, segments, result, revenue, file):
+    summary = metrics.compute_metrics(patterns, segments, result.x, revenue)
+    if result.feasible:
+        if revenue is not None:
+            print(f"最优总利润: {round(summary.profit, 2)}元", file=file)
+        print(f"最优总成本: {round(summary.total_cost, 2)}元", file=file)
+        if revenue is not None:
+            print(f"总销售额: {revenue}元", file=file)
+        print(f"材料利用率: {summary.utilization * 100:.2f}%", file=file)
+        print(f"综合损耗率: {summary.loss_rate * 100:.2f}%", file=file)
+
+        print("\n详细切割方案：", file=file)
+        for i in summary.used_patterns():
+            details = ", ".join(f"{k}:{v}" for k, v in patterns.pieces(i).items())
+            print(f"模式{i + 1}: 使用{result.x[i]}次, 包含[{details}]", file=file)
+    else:
+        print("未找到可行解", file=file)
+
+    print("\n需求满足验证：", file=file)
+    for seg, actual in zip(segments, summary.produced):
+        print(f"{seg['name']}: 需要{seg['demand']} 实际{actual}", file=file)
+    return summary
@@ -0,0 +1,80 @@
+"""有状态的规划器：原料、模式和模型只构建一次，需求变化时原地修改约束右端并热启动重解
+
+零件和原料可以是 pipeline.Segment/Material 或字典；PuLP 只在用 CBC 时加载。
+"""
+
+import time
+
+import numpy as np
+
+from cutting import core, model, parallel, pipeline, solvers
+
+
+class CuttingPlanner:
+    def __init__(self, patterns, segments, supply=None, backend='cbc', **backend_options):
+        """patterns 为 PatternStore（原料类编号可配合 supply 限制库存）；
+        backend 为 'cbc' 时保留 PuLP 模型并用上次的解作为 MIP 初始解，其他后端每次冷启动
+        """
+        self.patterns = patterns
+        self.segments = [dict(seg) for seg in pipeline.as_dicts(segments)]
+        self.supply = supply
+        self.backend_name = backend
+        self.backend = solvers.get_backend(backend, **backend_options)
+        self.index = {seg['name']: j for j, seg in enumerate(self.segments)}
+        self.groups = None
+        self.result = None
+        if backend == 'cbc':
+            self.prob, self.pattern_vars = model.build_pulp_model("Optimal_Cutting_Planner", patterns,
+                                                                  self.segments, supply=supply)
+            # 需求约束按零件序号保存，零件名可能被 PuLP 改写
+            self.demand_rows = [self.prob.constraints[f"demand_{j}"] for j in range(len(self.segments))]
+
+    @classmethod
+    def from_materials(cls, materials, segments, kerf=core.KERF, use_cache=True, finite_stock=False,
+                       max_counts=None, workers=1, backend='cbc', **backend_options):
+        """合并同类原料并生成模式（默认读写磁盘缓存，workers > 1 时多进程生成）
+
+        max_counts: 每种零件在一个模式中的件数上限（同 store.PatternStore.add_material），
+            之后用 update_demands 把需求调到上限以上时，解可能不再最优
+        """
+        materials, segments = pipeline.as_dicts(materials), pipeline.as_dicts(segments)
+        groups = core.group_materials(materials)
+        patterns = parallel.generate_store(groups, segments, kerf=kerf, workers=workers, use_cache=use_cache,
+                                           maximal_only=True, max_counts=max_counts)
+        supply = pipeline.stock_supply(materials) if finite_stock else None
+        planner = cls(patterns, segments, supply, backend, **backend_options)
+        planner.groups = groups
+        return planner
+
+    def update_demands(self, demands):
+        """demands: {零件名: 新需求}；只改约束右端，不重建模型"""
+        for name, demand in demands.items():
+            if name not in self.index:
+                raise KeyError(f"未知零件: {name}")
+            j = self.index[name]
+            self.segments[j]['demand'] = demand
+            if self.backend_name == 'cbc':
+                # PuLP 把 expr >= d 存为 expr - d >= 0
+                self.demand_rows[j].constant = -demand
+
+    def solve(self):
+        if self.backend_name != 'cbc':
+            self.result = self.backend.solve(self.patterns, self.segments, self.supply)
+            return self.result
+
+        import pulp
+
+        start = time.perf_counter()
+        warm = self.result is not None and self.result.feasible
+        if warm:
+            for var, n in zip(self.pattern_vars, self.result.x):
+                var.setInitialValue(n)
+        self.prob.solve(pulp.PULP_CBC_CMD(msg=self.backend.msg, threads=self.backend.threads,
+                                          timeLimit=self.backend.time_limit, gapRel=self.backend.mip_gap,
+                                          warmStart=warm))
+        x = np.array([var.value() or 0 for var in self.pattern_vars], dtype=float)
+        feasible = self.prob.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible)
+        self.result = solvers.SolveResult('cbc', self.prob.sol_status == pulp.LpSolutionOptimal, feasible,
+                                          pulp.value(self.prob.objective) if feasible else None, x,
+                                          time.perf_counter() - start)
+        return self.result
@@ -0,0 +1,37 @@
+"""绘图的公共设置：默认用非交互的 Agg 后端只写图片文件，没有显示器的机器上也能运行
+
+环境变量 MPLBACKEND（如 QtAgg）可改用交互后端，此时 show 写完文件后再弹出窗口；
+CUTTING_FIGURE_DIR 为图片输出目录，默认 figures/。matplotlib 在调用 pyplot() 时才导入。
+"""
+
+import os
+
+FIGURE_DIR = os.environ.get('CUTTING_FIGURE_DIR', 'figures')
+NON_INTERACTIVE = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
+
+
+def pyplot():
+    """按 MPLBACKEND（默认 Agg）选好后端后导入 pyplot"""
+    import matplotlib
+    matplotlib.use(os.environ.get('MPLBACKEND') or 'Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def figure_path(filename, figure_dir=None):
+    figure_dir = figure_dir or FIGURE_DIR
+    os.makedirs(figure_dir, exist_ok=True)
+    return os.path.join(figure_dir, filename)
+
+
+def show(filename, fig=None, figure_dir=None, dpi=300):
+    """把图（默认当前图）写入 figure_dir/filename，格式由扩展名决定（.png、.svg 等）；
+    交互后端下再显示。返回写出的路径
+    """
+    import matplotlib.pyplot as plt
+    fig = fig or plt.gcf()
+    path = figure_path(filename, figure_dir)
+    fig.savefig(path, dpi=dpi, bbox_inches='tight')
+    if plt.get_backend().lower() not in NON_INTERACTIVE:
+        plt.show()
+    return path
@@ -0,0 +1,239 @@
+"""报告渲染：由求解结果（模式库 + 解向量 + 汇总指标）直接画出模式使用热力图、原料利用饼图、
+财务柱状图和订单完成情况图，写成 PNG/SVG
+
+先在主进程里用 report_data 把结果压缩成只含已用模式的 ReportData，再交给 render_report 或
+render_reports。渲染不经 pyplot、不开窗口；每个进程只建一个 Figure，每张图清空后重画，
+render_reports 在多个子进程里并行渲染，批量出上百份报告也不用逐张重启解释器。
+
+运行: python -m cutting.render q1 q3 --formats png svg -o figures
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+from cutting import metrics
+
+CHARTS = ('usage_heatmap', 'utilization', 'financial', 'order_compliance')
+COLORS = {'cost': '#2ecc71', 'revenue': '#3498db', 'profit': '#e74c3c', 'pieces': '#2a788e',
+          'waste': '#7ad151', 'kerf': '#bdc3c7', 'demand': '#3498db', 'actual': '#27ae60', 'title': '#2c3e50'}
+
+_figure = None  # 每个进程复用的画布
+
+
+@dataclass
+class ReportData:
+    name: str  # 输出文件名前缀
+    pattern_labels: list  # 已用模式，'P{i+1}' 与文字报告中的“模式{i+1}”对应
+    material_labels: list  # 模式库中出现的原料长度，如 '5.5m'
+    usage: np.ndarray  # 已用模式 × 原料长度 的使用次数
+    segment_names: list
+    demand: np.ndarray
+    produced: np.ndarray
+    total_material: float
+    total_waste: float
+    total_kerf: float
+    utilization: float
+    total_cost: float
+    revenue: float = None
+    profit: float = None
+
+
+def report_data(name, patterns, segments, x, summary=None):
+    """patterns 为 PatternStore，x 为解向量（SolveResult.x）；summary 为已算好的 metrics.SolutionMetrics，
+    不给时按 x 计算（不含销售额）
+    """
+    summary = summary or metrics.compute_metrics(patterns, segments, x)
+    x = np.asarray(x, dtype=float)
+    used = np.flatnonzero(x > 0)
+    lengths = np.unique(patterns.material_length)
+    usage = np.zeros((len(used), len(lengths)))
+    usage[np.arange(len(used)), np.searchsorted(lengths, patterns.material_length[used])] = x[used]
+    return ReportData(
+        name=name,
+        pattern_labels=[f"P{i + 1}" for i in used],
+        material_labels=[f"{length:g}m" for length in lengths],
+        usage=usage,
+        segment_names=[seg['name'] for seg in segments],
+        demand=summary.demand,
+        produced=summary.produced,
+        total_material=summary.total_material,
+        total_waste=summary.total_waste,
+        total_kerf=summary.total_kerf,
+        utilization=summary.utilization,
+        total_cost=summary.total_cost,
+        revenue=summary.revenue,
+        profit=summary.profit,
+    )
+
+
+def _draw_usage_heatmap(fig, data):
+    rows, cols = data.usage.shape
+    fig.set_size_inches(max(6.0, 1.8 * cols + 3), max(4.0, 0.4 * rows + 2))
+    ax = fig.add_subplot()
+    if rows == 0:
+        ax.text(0.5, 0.5, 'No feasible solution', ha='center', va='center', fontsize=14)
+        ax.set_axis_off()
+        return
+    # 0 不着色也不标注
+    image = ax.imshow(np.ma.masked_equal(data.usage, 0), cmap='Blues', aspect='auto',
+                      vmin=0, vmax=max(data.usage.max(), 1))
+    threshold = data.usage.max() * 0.6
+    for r, c in zip(*np.nonzero(data.usage)):
+        value = data.usage[r, c]
+        ax.text(c, r, f"{value:g}", ha='center', va='center', fontsize=11,
+                color='white' if value > threshold else COLORS['title'])
+    ax.set_xticks(range(cols), [f"Material_{label}" for label in data.material_labels], rotation=45, ha='right')
+    ax.set_yticks(range(rows), data.pattern_labels)
+    ax.set_xlabel('Material Type', fontsize=12)
+    ax.set_ylabel('Cutting Pattern', fontsize=12)
+    ax.set_title('Cutting Pattern Material Usage Analysis', fontsize=15, fontweight='bold', color=COLORS['title'])
+    fig.colorbar(image, ax=ax, shrink=0.8, label='Usage Frequency')
+
+
+def _draw_utilization(fig, data):
+    fig.set_size_inches(7, 7)
+    ax = fig.add_subplot(aspect='equal')
+    if not data.total_material:
+        ax.text(0.5, 0.5, 'No material used', ha='center', va='center', fontsize=14)
+        ax.set_axis_off()
+        return
+    pieces = data.total_material - data.total_waste - data.total_kerf
+    sizes = [pieces, data.total_waste, data.total_kerf]
+    labels = ['Parts', 'Offcut Waste', 'Kerf Loss']
+    colors = [COLORS['pieces'], COLORS['waste'], COLORS['kerf']]
+    # 锯缝、余料占比很小，百分比放在图例里，扇区上只标不小于 3% 的
+    wedges, _, autotexts = ax.pie(sizes, colors=colors, startangle=90, explode=(0.05, 0, 0), pctdistance=0.75,
+                                  autopct=lambda pct: f"{pct:.2f}%" if pct >= 3 else '',
+                                  wedgeprops={'edgecolor': 'white', 'linewidth': 2})
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(12)
+    ax.legend(wedges, [f"{label} {size / data.total_material * 100:.2f}%" for label, size in zip(labels, sizes)],
+              loc='upper right', bbox_to_anchor=(1.05, 1.0), fontsize=11)
+    ax.set_title('Material Efficiency Analysis', fontsize=15, fontweight='bold', color=COLORS['title'])
+    ax.text(0.5, -0.05, f"Utilization {data.utilization * 100:.2f}% of {data.total_material:g} m",
+            ha='center', va='top', fontsize=12, transform=ax.transAxes,
+            bbox={'boxstyle': 'round,pad=0.5', 'fc': 'white', 'ec': '#34495e'})
+
+
+def _draw_financial(fig, data):
+    fig.set_size_inches(9, 6)
+    ax = fig.add_subplot()
+    categories, values, colors = ['Total Cost'], [data.total_cost], [COLORS['cost']]
+    if data.revenue is not None:
+        categories += ['Total Revenue', 'Net Profit']
+        values += [data.revenue, data.profit]
+        colors += [COLORS['revenue'], COLORS['profit']]
+    bars = ax.bar(range(len(values)), values, width=0.6, color=colors, edgecolor='black', linewidth=1.2, zorder=3)
+    top = max(max(values), 1)
+    for bar, value, color in zip(bars, values, colors):
+        ax.text(bar.get_x() + bar.get_width() / 2, max(value, 0) + top * 0.02, f"¥{value:,.2f}",
+                ha='center', va='bottom', fontsize=12, color=color, weight='bold',
+                bbox={'boxstyle': 'round', 'facecolor': 'white', 'edgecolor': color, 'alpha': 0.9})
+    ax.set_xticks(range(len(values)), categories, fontsize=12)
+    ax.set_ylim(min(min(values), 0) * 1.25, top * 1.2)
+    ax.yaxis.set_visible(False)
+    ax.grid(axis='y', linestyle='--', linewidth=1, alpha=0.4, zorder=0)
+    ax.set_title('Payments Analysis', fontsize=15, fontweight='bold', color=COLORS['title'])
+    if data.revenue:
+        ax.text(0.98, 0.95, f"Profit Margin: {data.profit / data.revenue * 100:.1f}%", ha='right', va='top',
+                fontsize=12, transform=ax.transAxes, bbox={'boxstyle': 'round', 'facecolor': 'white'})
+
+
+def _draw_order_compliance(fig, data):
+    n = len(data.segment_names)
+    fig.set_size_inches(max(8.0, 1.1 * n + 2), 6)
+    ax = fig.add_subplot()
+    index = np.arange(n)
+    width = 0.38
+    ax.bar(index - width / 2, data.demand, width, label='Requirement', color=COLORS['demand'], edgecolor='black')
+    actual = ax.bar(index + width / 2, data.produced, width, label='Actual', color=COLORS['actual'],
+                    edgecolor='black')
+    # 有缺口的零件描红边
+    for rect, short in zip(actual, data.produced < data.demand):
+        if short:
+            rect.set_edgecolor(COLORS['profit'])
+            rect.set_linewidth(2.5)
+    top = max(data.demand.max(initial=0), data.produced.max(initial=0), 1)
+    for x, value in zip(np.r_[index - width / 2, index + width / 2], np.r_[data.demand, data.produced]):
+        ax.text(x, value + top * 0.01, f"{value:.0f}", ha='center', va='bottom', fontsize=9)
+    ax.set_xticks(index, data.segment_names, rotation=30, ha='right')
+    ax.set_ylim(0, top * 1.25)
+    ax.set_ylabel('Pieces', fontsize=12)
+    ax.set_title('Order Specification Compliance Analysis', fontsize=15, fontweight='bold', color=COLORS['title'])
+    ax.legend(loc='upper right', ncols=2, framealpha=0.9)
+    ax.grid(axis='y', linestyle='--', linewidth=0.7, alpha=0.4)
+
+
+_DRAW = {'usage_heatmap': _draw_usage_heatmap, 'utilization': _draw_utilization,
+         'financial': _draw_financial, 'order_compliance': _draw_order_compliance}
+
+
+def _canvas():
+    global _figure
+    if _figure is None:
+        from matplotlib.figure import Figure
+        _figure = Figure(layout='constrained')
+    return _figure
+
+
+def render_report(data, output_dir, formats=('png',), charts=CHARTS, dpi=150):
+    """把一份 ReportData 的各图写入 output_dir/<name>_<图名>.<格式>，返回写出的路径"""
+    os.makedirs(output_dir, exist_ok=True)
+    fig = _canvas()
+    paths = []
+    for chart in charts:
+        fig.clear()
+        _DRAW[chart](fig, data)
+        for fmt in formats:
+            path = os.path.join(output_dir, f"{data.name}_{chart}.{fmt}")
+            fig.savefig(path, format=fmt, dpi=dpi)
+            paths.append(path)
+    fig.clear()
+    return paths
+
+
+def _render_task(task):
+    return render_report(*task)
+
+
+def render_reports(datas, output_dir, formats=('png',), charts=CHARTS, dpi=150, workers=None):
+    """并行渲染多份报告，返回各份报告写出的路径列表；workers 为 1 或只有一份时在本进程内渲染"""
+    tasks = [(data, output_dir, formats, charts, dpi) for data in datas]
+    workers = min(workers or os.cpu_count(), len(tasks))
+    if workers <= 1:
+        return [render_report(*task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_render_task, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+
+def instance_report(instance, **options):
+    """求解随附算例（instances.Instance）并整理成 ReportData；options 传给 pipeline.generate_patterns"""
+    from cutting import pipeline
+
+    patterns = pipeline.generate_patterns(instance.materials, instance.segments, **instance.options, **options)
+    result = pipeline.solve(patterns, instance.segments)
+    summary = metrics.compute_metrics(patterns, instance.segments, result.x, metrics.order_revenue(instance.segments))
+    return report_data(instance.name, patterns, instance.segments, result.x, summary)
+
+
+def main(argv=None):
+    from cutting import instances, plotting
+
+    parser = argparse.ArgumentParser(description='求解随附算例并渲染报告图表')
+    parser.add_argument('instances', nargs='*', choices=list(instances.SHIPPED), default=list(instances.SHIPPED))
+    parser.add_argument('-o', '--output', default=plotting.FIGURE_DIR)
+    parser.add_argument('--formats', nargs='+', default=['png'], choices=['png', 'svg', 'pdf'])
+    parser.add_argument('--workers', type=int, default=None, help='渲染进程数，默认为 CPU 核数')
+    args = parser.parse_args(argv)
+    datas = [instance_report(instances.SHIPPED[name]()) for name in args.instances]
+    for paths in render_reports(datas, args.output, args.formats, workers=args.workers):
+        print('\n'.join(paths))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""求解后端：PuLP/CBC、scipy.optimize.milp(HiGHS)、LP 松弛 + 取整启发式
+
+三个后端都接受 threads、time_limit（秒）、mip_gap（相对间隙），solve 返回统一的 SolveResult。
+PuLP 只在用 CBC 求解时导入。
+stats 里是后端自己的统计（分支节点数、单纯形迭代数等），打开 instrument 记录时也写进 'solve' 阶段。
+"""
+
+import math
+import os
+import re
+import tempfile
+import time
+from dataclasses import dataclass
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import milp, linprog, LinearConstraint, Bounds
+
+from cutting import instrument, model
+
+
+@dataclass
+class SolveResult:
+    backend: str
+    optimal: bool  # 求得（间隙内的）最优解
+    feasible: bool
+    objective: float
+    x: np.ndarray  # 各模式使用次数
+    runtime: float
+    bound: float = None  # 下界（LP 松弛或 MIP 对偶界），可用时给出
+    stats: dict = None  # 后端统计，键随后端而定
+
+
+class Backend:
+    name = None
+
+    def __init__(self, threads=None, time_limit=None, mip_gap=None, msg=False):
+        self.threads = threads
+        self.time_limit = time_limit
+        self.mip_gap = mip_gap
+        self.msg = msg
+
+    def solve(self, patterns, segments, supply=None):
+        """supply: 每类原料的可用根数列表（None 表示不限），见 model.supply_matrix"""
+        with instrument.span('solve', backend=self.name, patterns=len(patterns)) as attrs:
+            result = self._solve(patterns, segments, supply)
+            attrs.update(feasible=result.feasible, objective=result.objective, **(result.stats or {}))
+        return result
+
+    def _solve(self, patterns, segments, supply):
+        raise NotImplementedError
+
+
+class CbcBackend(Backend):
+    name = 'cbc'
+
+    def _solve(self, patterns, segments, supply):
+        import pulp
+
+        start = time.perf_counter()
+        prob, pattern_vars = model.build_pulp_model("Optimal_Cutting", patterns, segments, supply=supply)
+        # CBC 的统计只在日志里，记录时才让它写日志文件
+        log_path = None
+        if instrument.enabled():
+            fd, log_path = tempfile.mkstemp(suffix='.log', prefix='cbc_')
+            os.close(fd)
+        try:
+            prob.solve(pulp.PULP_CBC_CMD(msg=self.msg, threads=self.threads, timeLimit=self.time_limit,
+                                         gapRel=self.mip_gap, logPath=log_path))
+            stats = _cbc_stats(log_path) if log_path else None
+        finally:
+            if log_path:
+                os.remove(log_path)
+        x = np.array([var.value() or 0 for var in pattern_vars], dtype=float)
+        feasible = prob.sol_status in (pulp.LpSolutionOptimal, pulp.LpSolutionIntegerFeasible)
+        return SolveResult(self.name, prob.sol_status == pulp.LpSolutionOptimal, feasible,
+                           pulp.value(prob.objective) if feasible else None, x, time.perf_counter() - start,
+                           stats=stats)
+
+
+def _cbc_stats(log_path):
+    """从 CBC 日志末尾的汇总里取分支节点数和迭代数"""
+    with open(log_path, encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    stats = {}
+    for key, label in (('nodes', 'Enumerated nodes'), ('iterations', 'Total iterations')):
+        match = re.search(rf"{label}:\s+(\d+)", text)
+        if match:
+            stats[key] = int(match.group(1))
+    return stats
+
+
+class HighsBackend(Backend):
+    """scipy 的 HiGHS 接口不开放线程数，threads 参数在此后端被忽略"""
+    name = 'highs'
+
+    def _solve(self, patterns, segments, supply):
+        start = time.perf_counter()
+        counts = model.pattern_matrix(patterns)
+        costs = patterns.cost
+        demands = np.array([seg['demand'] for seg in segments], dtype=float)
+        options = {'disp': self.msg}
+        if self.time_limit is not None:
+            options['time_limit'] = self.time_limit
+        if self.mip_gap is not None:
+            options['mip_rel_gap'] = self.mip_gap
+        constraints = [LinearConstraint(counts.T.tocsr(), lb=demands, ub=np.inf)]
+        if supply is not None:
+            stock, available = model.supply_matrix(patterns, supply)
+            constraints.append(LinearConstraint(stock, lb=-np.inf, ub=available))
+        res = milp(c=costs, constraints=constraints, integrality=np.ones(len(patterns)),
+                   bounds=Bounds(0, np.inf), options=options)
+        feasible = res.x is not None
+        x = np.round(res.x) if feasible else np.zeros(len(patterns))
+        stats = {'nodes': getattr(res, 'mip_node_count', None), 'gap': getattr(res, 'mip_gap', None)}
+        return SolveResult(self.name, res.status == 0, feasible, float(costs @ x) if feasible else None, x,
+                           time.perf_counter() - start, getattr(res, 'mip_dual_bound', None), stats)
+
+
+class LpRoundingBackend(Backend):
+    """解 LP 松弛后取整修补，再按成本从高到低逐个减少多余的模式使用次数；不做分支，延迟可控"""
+    name = 'lp-round'
+
+    def _solve(self, patterns, segments, supply):
+        start = time.perf_counter()
+        counts = model.pattern_matrix(patterns)
+        costs = patterns.cost
+        demands = np.array([seg['demand'] for seg in segments], dtype=float)
+        options = {}
+        if self.time_limit is not None:
+            options['time_limit'] = self.time_limit
+        A_ub, b_ub = -counts.T.tocsr(), -demands
+        if supply is not None:
+            stock, available = model.supply_matrix(patterns, supply)
+            A_ub, b_ub = sparse.vstack([A_ub, stock]).tocsr(), np.concatenate([b_ub, available])
+        res = linprog(costs, A_ub=A_ub, b_ub=b_ub, bounds=(0, None), method='highs', options=options)
+        if res.x is None:
+            return SolveResult(self.name, False, False, None, np.zeros(len(patterns)), time.perf_counter() - start,
+                               stats={'iterations': res.nit})
+
+        # 向下取整后按“单位成本覆盖的缺口最多”逐根补足需求，补充时不超过库存
+        x = np.floor(res.x + 1e-9)
+        shortfall = np.maximum(demands - counts.T @ x, 0)
+        if supply is not None:
+            pattern_stock = stock.T.tocsr()
+            left = available - stock @ x
+        repairs = 0
+        while shortfall.any():
+            useful = counts.copy()
+            useful.data = np.minimum(useful.data, shortfall[useful.indices])
+            covered = np.asarray(useful.sum(axis=1)).ravel()
+            if supply is not None:
+                exhausted = (pattern_stock @ (left < 1)) > 0
+                covered[exhausted] = 0
+            ratio = np.divide(costs, covered, out=np.full(len(costs), np.inf), where=covered > 0)
+            i = int(np.argmin(ratio))
+            if not np.isfinite(ratio[i]):
+                return SolveResult(self.name, False, False, None, x, time.perf_counter() - start, res.fun,
+                                   {'iterations': res.nit, 'repairs': repairs})
+            x[i] += 1
+            repairs += 1
+            row = counts.getrow(i)
+            shortfall[row.indices] = np.maximum(shortfall[row.indices] - row.data, 0)
+            if supply is not None:
+                left -= stock[:, i].toarray().ravel()
+
+        produced = counts.T @ x
+        for i in np.argsort(-costs):
+            if x[i] == 0:
+                continue
+            row = counts.getrow(i)
+            # 在不破坏需求的前提下能去掉的最多次数
+            slack = min(((produced[j] - demands[j]) // n for j, n in zip(row.indices, row.data)), default=x[i])
+            drop = min(x[i], slack)
+            if drop > 0:
+                x[i] -= drop
+                produced[row.indices] -= drop * row.data
+        objective = float(costs @ x)
+        gap = (objective - res.fun) / objective if objective else 0.0
+        optimal = math.isclose(objective, res.fun) or (self.mip_gap is not None and gap <= self.mip_gap)
+        return SolveResult(self.name, optimal, True, objective, x, time.perf_counter() - start, res.fun,
+                           {'iterations': res.nit, 'repairs': repairs})
+
+
+BACKENDS = {backend.name: backend for backend in (CbcBackend, HighsBackend, LpRoundingBackend)}
+
+
+def get_backend(name, **options):
+    if name not in BACKENDS:
+        raise ValueError(f"未知的求解后端: {name}，可选: {', '.join(BACKENDS)}")
+    return BACKENDS[name](**options)
+
+
+def select_backend(n_patterns, time_limit=None):
+    """按问题规模选后端：HiGHS 在实测规模上都快于 CBC；超大模型且限制了时间时退回 LP 取整"""
+    if time_limit is not None and n_patterns > 200_000:
+        return 'lp-round'
+    return 'highs'
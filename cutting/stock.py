@@ -0,0 +1,177 @@
+"""原料库存表载入：按原材料编号把多行合并为一根带完整缺陷列表的原料，全程向量化解析
+
+读取 xlsx 要经过 openpyxl，很慢；首次读取后在表格旁写一份列式快照（.npy + .json 元数据），
+源文件的大小、修改时间或内容哈希不变时直接内存映射快照，跳过 pandas/openpyxl。
+"""
+
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from cutting import instrument
+
+ID_COLUMN = '原材料编号'
+LENGTH_COLUMN = '原材料长度 (米)'
+DEFECT_START_COLUMN = '缺陷位置 (米)'
+DEFECT_LENGTH_COLUMN = '缺陷长度 (米)'
+COST_COLUMN = '单价（元/根）'
+SNAPSHOT_VERSION = 1
+
+
+def materials_from_columns(ids, lengths, starts, defect_lengths, costs):
+    """每个下标为一行缺陷；同一编号的行合并为一根原料，单价取该编号第一行。
+
+    编号可以是整数、字符串或两者混合；编号缺失、缺陷越界、同一根原料上缺陷重叠或长度不一致时抛出 ValueError
+    """
+    # 编号按首次出现的顺序编码为整数，排序和比较都在编码上进行，不要求编号之间可比较
+    index = {}
+    codes = np.array([index.setdefault(v, len(index)) for v in np.asarray(ids, dtype=object).tolist()], dtype=np.intp)
+    labels = list(index)
+    missing = [c for c, label in enumerate(labels) if _is_missing(label)]
+    if missing:
+        # 在写快照之前拒绝，否则快照里的编码 -1 会被解成另一根原料
+        raise ValueError(f"原材料编号为空的行: {np.flatnonzero(np.isin(codes, missing)).tolist()}")
+    lengths, starts, defect_lengths, costs = (np.asarray(col, dtype=float) for col in
+                                              (lengths, starts, defect_lengths, costs))
+    has_defect = ~(np.isnan(starts) | np.isnan(defect_lengths))
+
+    bad = has_defect & ((starts < 0) | (defect_lengths <= 0) | (starts + defect_lengths > lengths + 1e-9))
+    if bad.any():
+        raise ValueError(f"缺陷超出原料范围，原材料编号: {_labels(labels, codes[bad])}")
+
+    # 按 (编号, 缺陷位置) 排序后，同一编号的行连续排列
+    order = np.lexsort((starts, codes))
+    codes, lengths, starts = codes[order], lengths[order], starts[order]
+    defect_lengths, has_defect, rows = defect_lengths[order], has_defect[order], order
+
+    same_bar = codes[1:] == codes[:-1]
+    mismatch = same_bar & (lengths[1:] != lengths[:-1])
+    if mismatch.any():
+        raise ValueError(f"同一编号的原料长度不一致: {_labels(labels, codes[1:][mismatch])}")
+    overlap = same_bar & has_defect[1:] & has_defect[:-1] & (starts[1:] < starts[:-1] + defect_lengths[:-1] - 1e-9)
+    if overlap.any():
+        raise ValueError(f"同一根原料上的缺陷重叠: {_labels(labels, codes[1:][overlap])}")
+
+    bounds = np.flatnonzero(np.r_[True, ~same_bar, True])
+    materials = []
+    # 编码即首次出现的顺序，各段已按编码排好
+    for k in range(len(bounds) - 1):
+        lo, hi = bounds[k], bounds[k + 1]
+        materials.append({
+            'id': labels[codes[lo]],
+            'length': lengths[lo].item(),
+            'cost': costs[rows[lo:hi].min()].item(),
+            'defects': [{'start': s, 'length': d} for s, d, ok in
+                        zip(starts[lo:hi].tolist(), defect_lengths[lo:hi].tolist(), has_defect[lo:hi]) if ok],
+        })
+    return materials
+
+
+def _is_missing(label):
+    try:
+        return label is None or bool(label != label)
+    except TypeError:
+        return True  # pd.NA 与任何值比较都不是布尔值
+
+
+def _labels(labels, codes):
+    """出错的编号，按首次出现的顺序"""
+    return [labels[c] for c in np.unique(codes)]
+
+
+def materials_from_frame(df):
+    return materials_from_columns(df[ID_COLUMN].to_numpy(), df[LENGTH_COLUMN], df[DEFECT_START_COLUMN],
+                                  df[DEFECT_LENGTH_COLUMN], df[COST_COLUMN])
+
+
+def _file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _snapshot_paths(path):
+    return path + '.snapshot.npy', path + '.snapshot.json'
+
+
+def _read_snapshot(path, sheet_name):
+    """快照有效时返回 (编号, 数值列矩阵)，否则返回 None"""
+    data_path, meta_path = _snapshot_paths(path)
+    try:
+        with open(meta_path, encoding='utf-8') as f:
+            meta = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    st = os.stat(path)
+    if meta.get('version') != SNAPSHOT_VERSION or meta.get('sheet') != sheet_name or meta['size'] != st.st_size:
+        return None
+    if meta['mtime_ns'] != st.st_mtime_ns:
+        # 只是修改时间变了（如重新拷贝）时比对内容哈希，相同则更新元数据继续使用
+        if meta['sha256'] != _file_hash(path):
+            return None
+        meta['mtime_ns'] = st.st_mtime_ns
+        _write_json(meta_path, meta)
+    try:
+        columns = np.load(data_path, mmap_mode='r')
+    except (FileNotFoundError, ValueError):
+        return None
+    # 编号可能整数与字符串混合，按对象数组解码，不统一转成字符串
+    labels = np.array(meta['labels'], dtype=object)
+    return labels[columns[:, 0].astype(np.intp)], columns[:, 1:]
+
+
+def _write_json(path, obj):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, ensure_ascii=False)
+    os.replace(tmp, path)
+
+
+def _write_snapshot(path, sheet_name, df):
+    import pandas as pd
+
+    data_path, meta_path = _snapshot_paths(path)
+    codes, labels = pd.factorize(df[ID_COLUMN])
+    columns = np.column_stack([
+        codes.astype(float),
+        df[LENGTH_COLUMN].to_numpy(dtype=float),
+        df[DEFECT_START_COLUMN].to_numpy(dtype=float),
+        df[DEFECT_LENGTH_COLUMN].to_numpy(dtype=float),
+        df[COST_COLUMN].to_numpy(dtype=float),
+    ])
+    st = os.stat(path)
+    tmp = f"{data_path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        np.save(f, columns)
+    os.replace(tmp, data_path)
+    # 元数据最后写入，数据文件写到一半时快照不会被误认为有效
+    _write_json(meta_path, {
+        'version': SNAPSHOT_VERSION, 'sheet': sheet_name, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+        'sha256': _file_hash(path), 'labels': labels.tolist(),
+    })
+
+
+def load_materials(path='附件.xlsx', sheet_name='Sheet1', use_snapshot=True):
+    with instrument.span('load_materials') as attrs:
+        if use_snapshot:
+            snapshot = _read_snapshot(path, sheet_name)
+            if snapshot is not None:
+                attrs['source'] = 'snapshot'
+                ids, columns = snapshot
+                return materials_from_columns(ids, *columns.T)
+
+        import pandas as pd
+
+        attrs['source'] = 'xlsx'
+        df = pd.read_excel(path, sheet_name=sheet_name)
+        materials = materials_from_frame(df)  # 先校验，非法表格不写快照
+        if use_snapshot:
+            try:
+                _write_snapshot(path, sheet_name, df)
+            except OSError:
+                pass  # 表格所在目录只读时照常返回
+        return materials
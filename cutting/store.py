@@ -0,0 +1,144 @@
+"""列式模式库：取代每个模式一个字典的表示
+
+计数矩阵按零件下标存放（最大件数不超过 255 时为 uint8，否则自动升为 uint16），
+原料长度、单价、余料、锯缝为并列的 float 数组，另有原料类编号一列。
+模式按批写入预分配的数组，容量不足时倍增；属性返回的都是零拷贝视图，
+求解器直接取计数矩阵，汇总指标只需与使用次数做点积。
+"""
+
+import numpy as np
+
+from cutting import core
+
+_COLUMNS = ('_counts', '_kerf_units', '_length', '_cost', '_waste', '_group')
+
+
+class PatternStore:
+    def __init__(self, segments, capacity=1024):
+        self.segments = segments
+        self.names = [seg['name'] for seg in segments]
+        self.seg_units = np.array([core.to_units(seg['length']) for seg in segments], dtype=np.int64)
+        self.size = 0
+        self._counts = np.zeros((capacity, len(segments)), dtype=np.uint8)
+        self._kerf_units = np.zeros(capacity, dtype=np.int32)
+        self._length = np.zeros(capacity)
+        self._cost = np.zeros(capacity)
+        self._waste = np.zeros(capacity)
+        self._group = np.full(capacity, -1, dtype=np.int32)
+
+    def __len__(self):
+        return self.size
+
+    def nbytes(self):
+        """已用部分占用的字节数"""
+        return sum(getattr(self, name)[:self.size].nbytes for name in _COLUMNS)
+
+    def _reserve(self, extra):
+        needed = self.size + extra
+        capacity = len(self._cost)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in _COLUMNS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.size] = old[:self.size]
+            setattr(self, name, new)
+
+    def append(self, counts, kerf_units, material_length, cost, group=-1):
+        """追加一批同一原料类的模式；counts 为（批量 × 零件数）矩阵，数据会被拷贝"""
+        counts = np.asarray(counts)
+        kerf_units = np.asarray(kerf_units)
+        n = len(kerf_units)
+        self._reserve(n)
+        if n and self._counts.dtype == np.uint8 and counts.max() > np.iinfo(np.uint8).max:
+            self._counts = self._counts.astype(np.uint16)
+        lo, hi = self.size, self.size + n
+        length_u = core.to_units(material_length)
+        self._counts[lo:hi] = counts
+        self._kerf_units[lo:hi] = kerf_units
+        self._length[lo:hi] = material_length
+        self._cost[lo:hi] = cost
+        # 余料先在整数毫米上算好再换算，与 core.make_pattern 一致
+        self._waste[lo:hi] = (length_u - counts @ self.seg_units - kerf_units) / core.UNIT
+        self._group[lo:hi] = group
+        self.size = hi
+
+    def add_material(self, material_length, material_cost, defects, kerf=core.KERF, group=-1, batch_size=4096,
+                     **options):
+        """按批把一根原料上所有可行的切割方式写入库中，返回新增模式数
+
+        include_empty: 是否输出不切割的空模式
+        free_end_cut: 零件恰好用完区间剩余长度时不计末端锯缝（问题1的规则）
+        maximal_only: 只保留任何区间都再放不下零件的极大模式，并去掉被支配的模式；
+            需求约束为 >= 时最优成本不变
+        max_counts: 每种零件在一个模式中的件数上限（如订单需求或剩余需求），超出的分支直接剪掉；
+            上限不小于需求时最优成本不变
+
+        只有一个无缺陷区间时用 core.knapsack_patterns 直接得到计数矩阵，否则走 DFS
+        """
+        start = self.size
+        capacities = core.interval_capacities(material_length, defects)
+        if len(capacities) == 1:
+            counts, kerf_units = core.knapsack_patterns(capacities[0], self.segments, kerf, **options)
+            self.append(counts, kerf_units, material_length, material_cost, group)
+            return self.size - start
+
+        for counts, kerf_units in core.iter_pattern_batches(material_length, defects, self.segments, kerf,
+                                                            batch_size, **options):
+            self.append(counts, kerf_units, material_length, material_cost, group)
+        # 支配过滤只在这根原料新写入的行上进行，保留的行原地前移
+        if options.get('maximal_only') and len(core.get_available_intervals(material_length, defects)) > 1:
+            kept = core.undominated(self._counts[start:self.size]) + start
+            self.size = start + len(kept)
+            for name in _COLUMNS:
+                array = getattr(self, name)
+                array[start:self.size] = array[kept]
+        return self.size - start
+
+    @property
+    def counts(self):
+        """计数矩阵（模式 × 零件）"""
+        return self._counts[:self.size]
+
+    @property
+    def kerf_units(self):
+        return self._kerf_units[:self.size]
+
+    @property
+    def cost(self):
+        return self._cost[:self.size]
+
+    @property
+    def group(self):
+        """原料类编号，未指定时为 -1"""
+        return self._group[:self.size]
+
+    @property
+    def material_length(self):
+        return self._length[:self.size]
+
+    @property
+    def waste(self):
+        return self._waste[:self.size]
+
+    @property
+    def kerf_loss(self):
+        return self.kerf_units / core.UNIT
+
+    def column(self, name):
+        """某个零件在各模式中的数量"""
+        return self._counts[:self.size, self.names.index(name)]
+
+    def pieces(self, i):
+        """第 i 个模式中的零件 {零件名: 数量}，只含数量大于 0 的零件"""
+        row = self._counts[i]
+        return {self.names[j]: int(row[j]) for j in np.flatnonzero(row)}
+
+    def pattern(self, i):
+        """第 i 个模式的字典形式（同 core.make_pattern，另带 'group'），只用于展示单个模式"""
+        p = core.make_pattern(float(self._length[i]), float(self._cost[i]), self.segments,
+                              self._counts[i].tolist(), int(self._kerf_units[i]))
+        p['group'] = int(self._group[i])
+        return p
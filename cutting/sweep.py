@@ -0,0 +1,150 @@
+"""情景扫描：批量求解需求/长度/原料/价格的不同组合，并行运行并汇总成一张结果表
+
+情景表为长格式 CSV，每行描述某个情景中的一个零件或一根原料：
+    scenario, type, name, length, demand, price, cost, defect_start, defect_length, count[, options]
+type=segment 的行用 name/length/demand/price（price 为该订单每樘窗的售价）；
+type=material 的行用 name/length/cost，同名多行表示同一根原料上的多个缺陷，count 为库存根数（空为不限）。
+可选的 options 列为该情景的模式生成规则，取情景中第一个非空值，多个用分号分隔，如 free_end_cut;include_empty
+（含义见 store.PatternStore.add_material）；为空时用命令行的 --options。模式总是只保留极大模式。
+
+运行: python -m cutting.sweep scenarios.csv -o results.csv --workers 32
+      python -m cutting.sweep scenarios.csv --options free_end_cut
+      python -m cutting.sweep scenarios.csv --reports reports/ --report-formats png svg
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from cutting import cache, core, metrics, parallel, render, solvers
+
+GENERATION_FLAGS = ('free_end_cut', 'include_empty')  # options 列和 --options 可用的生成规则
+
+
+def parse_flags(text):
+    """'free_end_cut;include_empty' → ('free_end_cut', 'include_empty')"""
+    flags = tuple(flag.strip() for flag in text.split(';') if flag.strip())
+    unknown = set(flags) - set(GENERATION_FLAGS)
+    if unknown:
+        raise ValueError(f"未知的生成规则: {', '.join(sorted(unknown))}，可选: {', '.join(GENERATION_FLAGS)}")
+    return flags
+
+
+def parse_scenarios(df):
+    """把长格式情景表（pandas.DataFrame）拆成 {情景名: (segments, materials, flags)}；
+    flags 为 options 列给出的生成规则，没有该列或为空时是 None
+    """
+    import pandas as pd
+
+    scenarios = {}
+    for name, rows in df.groupby('scenario', sort=False):
+        segs = rows[rows['type'] == 'segment']
+        segments = [{
+            'name': r['name'], 'length': float(r['length']), 'demand': int(r['demand']),
+            'price': float(r['price']) if pd.notna(r['price']) else 0.0,
+        } for _, r in segs.iterrows()]
+
+        materials = []
+        for mat_name, bar in rows[rows['type'] == 'material'].groupby('name', sort=False):
+            first = bar.iloc[0]
+            defects = [{'start': float(r['defect_start']), 'length': float(r['defect_length'])}
+                       for _, r in bar.iterrows() if pd.notna(r['defect_start'])]
+            count = int(first['count']) if 'count' in bar.columns and pd.notna(first['count']) else None
+            materials.append({'name': mat_name, 'length': float(first['length']), 'cost': float(first['cost']),
+                              'defects': defects, 'stock': count})
+        options = rows['options'].dropna() if 'options' in rows.columns else ()
+        scenarios[name] = (segments, materials, parse_flags(options.iloc[0]) if len(options) else None)
+    return scenarios
+
+
+def generation_options(segments, flags=()):
+    """情景的模式生成参数：只保留极大模式，每种零件的件数不超过该情景的需求"""
+    return {'maximal_only': True, 'max_counts': [seg['demand'] for seg in segments],
+            **{flag: True for flag in flags}}
+
+
+def _warm_cache(args):
+    group, segments, options, cache_dir = args
+    parallel.generate_store([group], segments, workers=1, cache_dir=cache_dir, **options)
+
+
+def solve_scenario(args):
+    """返回 (结果行, render.ReportData)；不要求报告或无可行解时后者为 None"""
+    name, segments, materials, options, backend_name, cache_dir, report = args
+    start = time.perf_counter()
+    groups = core.group_materials(materials)
+    patterns = parallel.generate_store(groups, segments, workers=1, cache_dir=cache_dir, **options)
+    supply = None
+    if any(mat['stock'] is not None for mat in materials):
+        supply = [group['stock'] for group in groups]
+
+    result = solvers.get_backend(backend_name or solvers.select_backend(len(patterns))).solve(
+        patterns, segments, supply)
+    status = 'optimal' if result.optimal else 'feasible' if result.feasible else 'infeasible'
+    row = {'scenario': name, 'status': status, 'patterns': len(patterns)}
+    data = None
+    if result.feasible:
+        revenue = metrics.order_revenue(segments)
+        summary = metrics.compute_metrics(patterns, segments, result.x, revenue)
+        row.update({
+            'cost': round(summary.total_cost, 2),
+            'revenue': revenue,
+            'profit': round(summary.profit, 2),
+            'utilization': summary.utilization,
+            'loss_rate': summary.loss_rate,
+        })
+        if report:
+            data = render.report_data(name, patterns, segments, result.x, summary)
+    row['runtime'] = time.perf_counter() - start
+    return row, data
+
+
+def run_sweep(scenarios, workers=None, backend_name=None, cache_dir=cache.CACHE_DIR, report_dir=None,
+              report_formats=('png',), flags=()):
+    """scenarios 同 parse_scenarios 的返回值，flags 为情景没有指定生成规则时的默认规则。
+    先按指纹去重并行生成模式库（写入共享的磁盘缓存），再并行求解各情景，返回结果 DataFrame。
+    给出 report_dir 时，各可行情景的图表由 render.render_reports 并行写入该目录
+    """
+    import pandas as pd
+
+    tasks, unique = [], {}
+    for name, (segments, materials, scenario_flags) in scenarios.items():
+        options = generation_options(segments, flags if scenario_flags is None else scenario_flags)
+        tasks.append((name, segments, materials, options, backend_name, cache_dir, report_dir is not None))
+        for group in core.group_materials(materials):
+            key = cache.fingerprint(group['length'], group['defects'], segments, **options)
+            unique.setdefault(key, (group, segments, options, cache_dir))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_warm_cache, unique.values()))
+        rows, datas = zip(*pool.map(solve_scenario, tasks)) if tasks else ((), ())
+    if report_dir is not None:
+        render.render_reports([data for data in datas if data is not None], report_dir, report_formats,
+                              workers=workers)
+    return pd.DataFrame(list(rows))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='并行情景扫描')
+    parser.add_argument('scenarios', help='长格式情景表 CSV')
+    parser.add_argument('-o', '--output', default='sweep_results.csv')
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--backend', choices=list(solvers.BACKENDS), default=None)
+    parser.add_argument('--cache-dir', default=cache.CACHE_DIR)
+    parser.add_argument('--options', nargs='*', default=[], choices=GENERATION_FLAGS,
+                        help='情景表没有 options 列或为空时使用的生成规则')
+    parser.add_argument('--reports', default=None, help='把各情景的图表写入此目录')
+    parser.add_argument('--report-formats', nargs='+', default=['png'], choices=['png', 'svg', 'pdf'])
+    args = parser.parse_args()
+
+    import pandas as pd
+    scenarios = parse_scenarios(pd.read_csv(args.scenarios))
+    results = run_sweep(scenarios, args.workers, args.backend, args.cache_dir, args.reports, args.report_formats,
+                        args.options)
+    results.to_csv(args.output, index=False)
+    print(results.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
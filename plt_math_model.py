@@ -1,7 +1,7 @@
 """
-import matplotlib
-matplotlib.use('Qt5Agg')
-import matplotlib.pyplot as plt
+from cutting import plotting
+
+plt = plotting.pyplot()
 from matplotlib.patches import Patch
 import numpy as np  # 添加缺失的numpy导入
 
@@ -65,17 +65,16 @@ def plot_material_defects(mat, figsize=(8, 2)):
 
 # 生成示意图
 plot_material_defects(materials[0], figsize=(8, 1.5))
-plt.show()
+plotting.show('material_defects_1.png')
 
 plot_material_defects(materials[1], figsize=(8, 1.5))
-plt.show()
+plotting.show('material_defects_2.png')
 """
 
 """
-import matplotlib
+from cutting import plotting
 
-matplotlib.use('Qt5Agg')
-import matplotlib.pyplot as plt
+plt = plotting.pyplot()
 from matplotlib.patches import Patch
 import numpy as np  # 添加缺失的numpy导入
 
@@ -138,7 +137,7 @@ def plot_material_defects(mat, figsize=(8, 2)):
 
 
 plot_material_defects(materials[1], figsize=(8, 1.5))
-plt.show()
+plotting.show('material_defects_2.png')
 """
 
 
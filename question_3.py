@@ -1,110 +1,27 @@
-import pulp
-from pulp import LpProblem, LpMinimize, LpVariable, LpInteger, lpSum, LpStatus, value
-import pandas as pd
-import plotly.graph_objects as go
+"""问题3：附件.xlsx 中的带缺陷原料，最大化利润（销售额固定，即最小化原料成本）"""
+import argparse
+import time
 
+import numpy as np
 
-# segments = [
-#     {'name': 'order1_width', 'length': 1.61, 'demand': 120 * 2},
-#     {'name': 'order1_height', 'length': 2.21, 'demand': 120 * 2},
-#     {'name': 'order2_width', 'length': 1.81, 'demand': 80 * 2},
-#     {'name': 'order2_height', 'length': 2.41, 'demand': 80 * 2},
-#     {'name': 'order3_width', 'length': 1.71, 'demand': 60 * 2},
-#     {'name': 'order3_height', 'length': 2.31, 'demand': 60 * 2},
-#     {'name': 'order4_width', 'length': 1.51, 'demand': 40 * 2},
-#     {'name': 'order4_height', 'length': 2.01, 'demand': 40 * 2},
-# ]
+import cutting
+from cutting import colgen, core, instances, instrument, metrics, plotting, solvers
 
-segments = [
-    {'name': 'order1_width', 'length': 1.59, 'demand': 120 * 2},
-    {'name': 'order1_height', 'length': 2.19, 'demand': 120 * 2},
-    {'name': 'order2_width', 'length': 1.79, 'demand': 80 * 2},
-    {'name': 'order2_height', 'length': 2.39, 'demand': 80 * 2},
-    {'name': 'order3_width', 'length': 1.69, 'demand': 60 * 2},
-    {'name': 'order3_height', 'length': 2.29, 'demand': 60 * 2},
-    {'name': 'order4_width', 'length': 1.49, 'demand': 40 * 2},
-    {'name': 'order4_height', 'length': 1.99, 'demand': 40 * 2},
-]
 
+def visualize_results(patterns, usage, segments, figure_dir=None):
+    """桑基图和平行坐标图写成 HTML 文件（见 plotting.figure_path），不弹出浏览器"""
+    import pandas as pd
+    import plotly.graph_objects as go
 
-def load_materials():
-    df = pd.read_excel('附件.xlsx', sheet_name='Sheet1')
-
-    materials = []
-    for _, row in df.iterrows():
-        mat_info = {
-            'length': row['原材料长度 (米)'],
-            'cost': row['单价（元/根）'],
-            'defects': [{
-                'start': row['缺陷位置 (米)'],
-                'length': row['缺陷长度 (米)']
-            }]
-        }
-        materials.append(mat_info)
-    return materials
-
-
-def get_available_intervals(material_length, defects):
-    sorted_defects = sorted(defects, key=lambda x: x['start'])
-    available = []
-    current_start = 0.0
-    for defect in sorted_defects:
-        defect_end = defect['start'] + defect['length']
-        if current_start < defect['start']:
-            available.append({'start': current_start, 'end': defect['start']})
-        current_start = max(current_start, defect_end)
-    if current_start < material_length:
-        available.append({'start': current_start, 'end': material_length})
-    return available
-
-
-def generate_patterns(material_length, material_cost, defects):
-    available_intervals = get_available_intervals(material_length, defects)
-    interval_lengths = [round(interval['end'] - interval['start'], 6) for interval in available_intervals]
-    patterns = []
-    KERF = 0.005
-
-    def dfs(seg_idx, remaining_intervals, current_pattern, total_used, total_kerf):
-        if current_pattern:
-            patterns.append({
-                'material_length': material_length,
-                'cost': material_cost,
-                'pattern': current_pattern.copy(),
-                'total_used': total_used + total_kerf,
-                'waste': material_length - (total_used + total_kerf),
-                'kerf_loss': total_kerf
-            })
-
-        for i in range(seg_idx, len(segments)):
-            seg = segments[i]
-            required_length = round(seg['length'] + KERF, 6)
-
-            for interval_idx in range(len(remaining_intervals)):
-                if remaining_intervals[interval_idx] >= required_length:
-                    new_remaining = [round(r, 6) for r in remaining_intervals]
-                    new_remaining[interval_idx] = round(new_remaining[interval_idx] - required_length, 6)
-
-                    new_pattern = current_pattern.copy()
-                    key = seg['name']
-                    new_pattern[key] = new_pattern.get(key, 0) + 1
-
-                    dfs(i, new_remaining, new_pattern,
-                        round(total_used + seg['length'], 6),
-                        round(total_kerf + KERF, 6))
-
-    dfs(0, interval_lengths, {}, 0.0, 0.0)
-    return patterns
-
-def visualize_results(patterns, pattern_vars, segments):
     # 数据处理
     active_patterns = [{
         'id': i,
-        'vars': int(var.value()),
-        'pattern': p['pattern'],
-        'material': p['material_length'],
-        'cost': p['cost'],
-        'waste': p['waste']
-    } for i, (var, p) in enumerate(zip(pattern_vars, patterns)) if var.value() > 0]
+        'vars': int(usage[i]),
+        'pattern': patterns.pieces(i),
+        'material': patterns.material_length[i],
+        'cost': patterns.cost[i],
+        'waste': patterns.waste[i]
+    } for i in np.flatnonzero(usage > 0)]
 
     # 桑基图数据准备
     labels = []
@@ -152,7 +69,7 @@ def visualize_results(patterns, pattern_vars, segments):
     ))
 
     fig.update_layout(title_text="Material Allocation Sankey Diagram", font_size=10)
-    fig.show()
+    fig.write_html(plotting.figure_path('question3_sankey.html', figure_dir))
 
     # 平行坐标图数据准备
     para_data = []
@@ -185,77 +102,55 @@ def visualize_results(patterns, pattern_vars, segments):
     ))
 
     para_fig.update_layout(title_text="Cutting Pattern Parallel Coordinates")
-    para_fig.show()
-
-def main():
-    materials = load_materials()
-
-    all_patterns = []
-    for mat in materials:
-        patterns = generate_patterns(mat['length'], mat['cost'], mat['defects'])
-        all_patterns.extend(patterns)
-
-    for i in all_patterns:
-        print(i)
-
-    prob = LpProblem("Optimal_Cutting_Defects_Problem3", LpMinimize)
-
-    pattern_vars = [
-        LpVariable(f"Pattern_{i}", lowBound=0, cat=LpInteger)
-        for i in range(len(all_patterns))
-    ]
-
-    revenue = sum(seg['demand'] // 2 * price for seg, price in [
-        (segments[0], 480), (segments[1], 480),
-        (segments[2], 680), (segments[3], 680),
-        (segments[4], 550), (segments[5], 550),
-        (segments[6], 420), (segments[7], 420)
-    ]) / 2
-
-    prob += lpSum([var * all_patterns[i]['cost'] for i, var in enumerate(pattern_vars)])
-
-    for seg in segments:
-        seg_total = lpSum([
-            var * all_patterns[i]['pattern'].get(seg['name'], 0)
-            for i, var in enumerate(pattern_vars)
-        ])
-        prob += seg_total >= seg['demand']
-
-    prob.solve()
-
-    if prob.status == pulp.LpStatusOptimal:
-        total_cost = value(prob.objective)
-        total_material = sum(var.value() * p['material_length'] for var, p in zip(pattern_vars, all_patterns))
-        total_waste = sum(var.value() * p['waste'] for var, p in zip(pattern_vars, all_patterns))
-        total_kerf = sum(var.value() * p['kerf_loss'] for var, p in zip(pattern_vars, all_patterns))
-
-        utilization = (total_material - total_waste) / total_material if total_material != 0 else 0
-        loss_rate = (total_waste + total_kerf) / total_material if total_material != 0 else 0
-
-        print(f"最优总利润: {revenue - total_cost}元")
-        print(f"最优总成本: {total_cost.round(2)}元")
-        print(f"总销售额: {revenue}元")
-        print(f"材料利用率: {utilization * 100:.2f}%")
-        print(f"综合损耗率: {loss_rate * 100:.2f}%")
-
-        print("\n详细切割方案：")
-        for i, var in enumerate(pattern_vars):
-            if var.value() > 0:
-                details = ", ".join(f"{k}:{v}" for k, v in all_patterns[i]['pattern'].items())
-                print(f"模式{i + 1}: 使用{var.value()}次, 包含[{details}]")
+    para_fig.write_html(plotting.figure_path('question3_parallel_coordinates.html', figure_dir))
+
+
+def main(mode='exhaustive', backend_name=None, threads=None, time_limit=None, mip_gap=None, use_cache=True,
+         finite_stock=False, workers=None):
+    start_time = time.perf_counter()
+    instance = instances.question_3()
+    segments = instance.segments
+    # 长度、单价、缺陷布局相同的行合并为一类原料，每类只生成一次模式
+    groups = core.group_materials(instance.materials)
+    supply = [group['count'] for group in groups] if finite_stock else None
+    revenue = metrics.order_revenue(segments)
+
+    options = {'threads': threads, 'time_limit': time_limit, 'mip_gap': mip_gap}
+    if mode == 'colgen':
+        backend = solvers.get_backend(backend_name or 'highs', **options)
+        all_patterns, result = colgen.solve_column_generation(groups, segments, backend, supply)
     else:
-        print("未找到可行解")
+        all_patterns = cutting.generate_patterns(instance.materials, segments, workers=workers, use_cache=use_cache,
+                                                 **instance.options)
 
-    print("\n需求满足验证：")
-    for seg in segments:
-        actual = sum(var.value() * all_patterns[i]['pattern'].get(seg['name'], 0) for i, var in enumerate(pattern_vars))
-        print(f"{seg['name']}: 需要{seg['demand']} 实际{actual}")
+        for i in range(len(all_patterns)):
+            print(all_patterns.pattern(i))
 
-    # visualize_results(all_patterns, pattern_vars, segments)
+        result = cutting.solve(all_patterns, segments, backend_name, supply, **options)
 
+    metrics_result = cutting.report(all_patterns, segments, result, revenue)
+    print(f"\n原料类数: {len(groups)}, 模式数: {len(all_patterns)}, 求解模式: {mode}, "
+          f"后端: {result.backend}{'' if result.optimal else '（未证明最优）'}, 求解耗时: {result.runtime:.2f}秒, "
+          f"总耗时: {time.perf_counter() - start_time:.2f}秒")
 
-if __name__ == "__main__":
-    main()
-
+    # visualize_results(all_patterns, result.x, segments)
+    return metrics_result
 
 
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mode', choices=['exhaustive', 'colgen'], default='exhaustive',
+                        help='exhaustive: 全量枚举模式; colgen: 列生成')
+    parser.add_argument('--backend', choices=list(solvers.BACKENDS), default=None,
+                        help='求解后端，默认按模式数自动选择')
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--time-limit', type=float, default=None, help='求解时间上限（秒）')
+    parser.add_argument('--mip-gap', type=float, default=None, help='相对 MIP 间隙')
+    parser.add_argument('--no-cache', action='store_true', help='不读写磁盘模式库缓存')
+    parser.add_argument('--finite-stock', action='store_true', help='每类原料最多使用表中的根数')
+    parser.add_argument('--workers', type=int, default=None, help='生成模式的进程数，默认为 CPU 核数')
+    instrument.add_arguments(parser)
+    args = parser.parse_args()
+    with instrument.session(args.metrics, args.profile):
+        main(args.mode, args.backend, args.threads, args.time_limit, args.mip_gap, not args.no_cache,
+             args.finite_stock, args.workers)
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+
+from cutting import cache
+
+SEGMENTS = [{'name': 'a', 'length': 1.6, 'demand': 10, 'price': 480},
+            {'name': 'b', 'length': 2.2, 'demand': 1, 'price': 480}]
+
+
+def test_fingerprint_ignores_price_and_caps_that_do_not_bind():
+    base = cache.fingerprint(6.2, [], SEGMENTS, maximal_only=True)
+    repriced = [dict(seg, price=0) for seg in SEGMENTS]
+    assert cache.fingerprint(6.2, [], repriced, maximal_only=True) == base
+    # 6.2m 最多放 3 根 a、2 根 b，上限 10 不起作用
+    assert cache.fingerprint(6.2, [], SEGMENTS, maximal_only=True, max_counts=[10, 2]) == base
+    assert cache.fingerprint(6.2, [], SEGMENTS, maximal_only=True, max_counts=[10, 1]) != base
+    assert cache.fingerprint(6.2, [], SEGMENTS, maximal_only=False) != base
+
+def test_fingerprint_keys_on_defect_layout():
+    # 两根 6.2m 原料的无缺陷区间都是 1.0m 和 5.17m，缺陷位置不同
+    left = [{'start': 1.0, 'length': 0.03}]
+    right = [{'start': 5.17, 'length': 0.03}]
+    assert cache.fingerprint(6.2, left, SEGMENTS) == cache.fingerprint(6.2, right, SEGMENTS)
+    assert cache.fingerprint(6.2, left, SEGMENTS) != cache.fingerprint(6.2, [{'start': 2.0, 'length': 0.03}],
+                                                                     SEGMENTS)
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    counts, kerf_units = np.ones((4, 2)), np.ones(4)
+    for i, length in enumerate((5.5, 6.2, 7.8)):
+        cache.put(length, [], SEGMENTS, counts, kerf_units, cache_dir=tmp_path)
+        path = tmp_path / (cache.fingerprint(length, [], SEGMENTS) + '.npz')
+        os.utime(path, (1000 + i, 1000 + i))
+    assert cache.lookup(5.5, [], SEGMENTS, cache_dir=tmp_path) is not None  # 刷新最旧的一个
+
+    size = max(entry.stat().st_size for entry in tmp_path.iterdir())
+    cache.evict(tmp_path, max_bytes=2 * size)
+    assert cache.lookup(6.2, [], SEGMENTS, cache_dir=tmp_path) is None
+    for length in (5.5, 7.8):
+        assert cache.lookup(length, [], SEGMENTS, cache_dir=tmp_path) is not None
+
+
+def test_evict_tolerates_files_removed_concurrently(tmp_path, monkeypatch):
+    cache.put(6.2, [], SEGMENTS, np.ones((1, 2)), np.ones(1), cache_dir=tmp_path)
+    listdir = os.listdir
+    monkeypatch.setattr(os, 'listdir', lambda path: listdir(path) + ['gone.npz'])
+    cache.evict(tmp_path, max_bytes=0)
+    monkeypatch.undo()
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,38 @@
+"""列生成与全量枚举在随附算例上的对照"""
+
+import pytest
+
+from cutting import colgen, core, instances, pipeline, solvers
+
+
+def _instance(name, divisor):
+    instance = instances.SHIPPED[name]()
+    segments = [dict(seg, demand=-(-seg['demand'] // divisor)) for seg in instance.segments]
+    return instance, segments
+
+
+@pytest.mark.parametrize('name, divisor, finite_stock, optimum', [
+    ('q2', 1, False, 2240.0),
+    ('q2', 1, True, None),  # 问题二每种原料只有一根，放不下全部订单
+    ('q3', 1, False, 8177.04),
+    ('q3', 8, True, 1058.6),
+])
+def test_column_generation_matches_exhaustive(name, divisor, finite_stock, optimum):
+    instance, segments = _instance(name, divisor)
+    groups = core.group_materials(instance.materials)
+    supply = [group['count'] for group in groups] if finite_stock else None
+    patterns = pipeline.generate_patterns(instance.materials, segments, use_cache=False, workers=1,
+                                          **instance.options)
+    exhaustive = pipeline.solve(patterns, segments, 'highs', supply)
+    columns, result = colgen.solve_column_generation(groups, segments, solvers.get_backend('highs'), supply)
+
+    if optimum is None:
+        assert not exhaustive.feasible and not result.feasible
+        return
+    assert exhaustive.objective == pytest.approx(optimum)
+    # LP 松弛的最优值相同；整数解只在已生成的列上求，不会优于全量枚举
+    lp_bound = pipeline.solve(columns, segments, 'lp-round', supply).bound
+    assert lp_bound == pytest.approx(pipeline.solve(patterns, segments, 'lp-round', supply).bound)
+    assert result.objective >= exhaustive.objective - 1e-6
+    if name == 'q3':
+        assert result.objective == pytest.approx(optimum)
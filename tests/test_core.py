@@ -0,0 +1,101 @@
+import itertools
+import random
+
+import numpy as np
+import pytest
+
+from cutting import core, parallel, store
+
+
+def interval_packings(capacity, seg_units, kerf_u, free_end_cut):
+    """单个区间能放下的 {计数元组: (锯缝, 剩余长度)}"""
+    packings = {}
+    for counts in itertools.product(*(range(capacity // u + 1) for u in seg_units)):
+        pieces = sum(counts)
+        used = sum(n * (u + kerf_u) for n, u in zip(counts, seg_units))
+        if used <= capacity:
+            packings[counts] = (pieces * kerf_u, capacity - used)
+        elif free_end_cut and pieces and used - kerf_u == capacity:
+            packings[counts] = ((pieces - 1) * kerf_u, 0)
+    return packings
+
+
+def brute_force(material_length, defects, segments, kerf=core.KERF, include_empty=False, free_end_cut=False,
+                maximal_only=False, max_counts=None):
+    """逐个区间枚举装法再组合，返回 {计数元组: 最小锯缝}；maximal_only 只要求某种分配下各区间都放不下未达上限的零件"""
+    seg_units = [core.to_units(seg['length']) for seg in segments]
+    kerf_u = core.to_units(kerf)
+    limits = max_counts or [float('inf')] * len(segments)
+    per_interval = [interval_packings(cap, seg_units, kerf_u, free_end_cut)
+                    for cap in core.interval_capacities(material_length, defects)]
+    found = {}
+    for allocation in itertools.product(*(p.items() for p in per_interval)):
+        counts = tuple(map(sum, zip(*(c for c, _ in allocation)))) if allocation else (0,) * len(segments)
+        if any(n > limit for n, limit in zip(counts, limits)) or not (include_empty or any(counts)):
+            continue
+        if maximal_only:
+            open_units = [u for u, n, limit in zip(seg_units, counts, limits) if n < limit]
+            if any(r >= u + kerf_u or (free_end_cut and r == u) for _, (_, r) in allocation for u in open_units):
+                continue
+        kerf_total = sum(k for _, (k, _) in allocation)
+        found[counts] = min(kerf_total, found.get(counts, kerf_total))
+    return found
+
+
+def random_instances(n, seed=0):
+    rng = random.Random(seed)
+    for _ in range(n):
+        segments = [{'name': f"s{j}", 'length': round(rng.uniform(0.3, 1.6), 2), 'demand': rng.randint(1, 4)}
+                    for j in range(rng.randint(1, 4))]
+        length = round(rng.uniform(1.5, 4.0), 2)
+        defects = [{'start': round(rng.uniform(0, length - 0.2), 2), 'length': round(rng.uniform(0.01, 0.2), 2)}
+                   for _ in range(rng.randint(0, 3))]
+        options = {
+            'include_empty': rng.random() < 0.3,
+            'free_end_cut': rng.random() < 0.5,
+            'max_counts': [seg['demand'] for seg in segments] if rng.random() < 0.5 else None,
+        }
+        yield length, defects, segments, options
+
+
+@pytest.mark.parametrize('maximal_only', [False, True])
+def test_iter_patterns_matches_brute_force(maximal_only):
+    for length, defects, segments, options in random_instances(150, seed=int(maximal_only)):
+        emitted = list(core.iter_patterns(length, defects, segments, maximal_only=maximal_only, **options))
+        assert len({row for row, _ in emitted}) == len(emitted), "同一组合输出了多次"
+        expected = brute_force(length, defects, segments, maximal_only=maximal_only, **options)
+        assert dict(emitted) == expected, (length, defects, segments, options)
+
+
+def test_free_end_cut_keeps_smallest_kerf():
+    # 三个缺陷把 2 米原料分成 0.6/0.5/0.4 米的区间：0.5 米零件在第一个区间要计锯缝，在第二个区间恰好切到末端
+    segments = [{'name': 'a', 'length': 0.3, 'demand': 1}, {'name': 'b', 'length': 0.5, 'demand': 1},
+                {'name': 'c', 'length': 0.6, 'demand': 1}]
+    defects = [{'start': 0.6, 'length': 0.1}, {'start': 1.2, 'length': 0.1}, {'start': 1.7, 'length': 0.3}]
+    emitted = dict(core.iter_patterns(2.0, defects, segments, free_end_cut=True))
+    assert emitted[(0, 1, 0)] == 0
+    assert emitted == brute_force(2.0, defects, segments, free_end_cut=True)
+
+
+def test_first_choice_branches_cover_all_patterns():
+    for length, defects, segments, options in random_instances(60, seed=2):
+        full = dict(core.iter_patterns(length, defects, segments, **options))
+        merged = {}
+        for first_choice in range(len(segments) + 1):
+            for row, k in core.iter_patterns(length, defects, segments, first_choice=first_choice, **options):
+                merged[row] = min(k, merged.get(row, k))
+        assert merged == full
+
+
+def test_parallel_store_matches_sequential():
+    segments = [{'name': f"s{j}", 'length': u, 'demand': 9} for j, u in enumerate([0.41, 0.53, 0.67, 0.9])]
+    groups = [{'length': 4.0, 'cost': 12, 'defects': [{'start': 1.3, 'length': 0.05}, {'start': 2.6, 'length': 0.1}]},
+              {'length': 3.0, 'cost': 9, 'defects': []}]
+    sequential = store.PatternStore(segments)
+    for g, group in enumerate(groups):
+        sequential.add_material(group['length'], group['cost'], group['defects'], group=g, maximal_only=True)
+    patterns = parallel.generate_store(groups, segments, workers=1, use_cache=False, split_pieces=1,
+                                       maximal_only=True)
+    assert np.array_equal(patterns.counts, sequential.counts)
+    assert np.array_equal(patterns.kerf_units, sequential.kerf_units)
+    assert np.array_equal(patterns.group, sequential.group)
@@ -0,0 +1,28 @@
+from cutting import instrument, store
+
+
+SEGMENTS = [{'name': 'a', 'length': 0.7, 'demand': 1}, {'name': 'b', 'length': 1.1, 'demand': 1}]
+
+
+def test_disabled_is_noop():
+    assert not instrument.enabled()
+    with instrument.span('x') as attrs:
+        attrs['ignored'] = 1
+    instrument.count('ignored')
+    assert not instrument.enabled()
+
+
+def test_recording_collects_nested_spans_and_dfs_counters(tmp_path):
+    with instrument.recording(str(tmp_path / 'run.prof')) as rec:
+        with instrument.span('outer', tag='t'):
+            patterns = store.PatternStore(SEGMENTS)
+            patterns.add_material(3.0, 1.0, [{'start': 1.2, 'length': 0.1}])
+    assert not instrument.enabled()
+    assert [s['path'] for s in rec.spans][-1] == 'outer'
+    assert rec.spans[-1]['tag'] == 't'
+    assert rec.counters['dfs_emitted'] >= len(patterns) > 0
+    assert rec.counters['dfs_nodes'] >= rec.counters['dfs_emitted']
+    assert (tmp_path / 'run.prof').stat().st_size > 0
+
+    rec.to_json(str(tmp_path / 'run.json'))
+    assert 'outer' in rec.summary()
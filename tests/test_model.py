@@ -0,0 +1,22 @@
+"""PuLP 模型的约束命名"""
+
+import pulp
+
+from cutting import core, model, parallel, solvers
+
+
+def _solve(segments):
+    groups = core.group_materials([{'length': 6.2, 'cost': 22, 'defects': []}])
+    patterns = parallel.generate_store(groups, segments, workers=1, use_cache=False, maximal_only=True)
+    prob, pattern_vars = model.build_pulp_model("Test_Names", patterns, segments)
+    prob.solve(pulp.PULP_CBC_CMD(msg=False))
+    return prob, solvers.get_backend('highs').solve(patterns, segments).objective
+
+
+def test_constraints_are_named_by_segment_index():
+    # 空格和 '-' 会被 PuLP 改写，'order 1-w' 与 'order_1_w' 改写后同名
+    segments = [{'name': 'order 1-w', 'length': 1.6, 'demand': 7},
+                {'name': 'order_1_w', 'length': 2.2, 'demand': 5}]
+    prob, objective = _solve(segments)
+    assert list(prob.constraints) == ['demand_0', 'demand_1']
+    assert prob.status == pulp.LpStatusOptimal and pulp.value(prob.objective) == objective
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+
+import numpy as np
+
+import cutting
+from cutting import instances
+
+
+def test_dataclasses_and_dicts_give_the_same_solution():
+    instance = instances.question_2()
+    segments = [cutting.Segment(seg['name'], seg['length'], seg['demand'], seg['price']) for seg in instance.segments]
+    materials = [cutting.Material(mat['length'], mat['cost'], [(d['start'], d['length']) for d in mat['defects']])
+                 for mat in instance.materials]
+    results = []
+    for segs, mats in ((segments, materials), (instance.segments, instance.materials)):
+        patterns = cutting.generate_patterns(mats, segs, use_cache=False, workers=1, **instance.options)
+        results.append((len(patterns), cutting.solve(patterns, segs, 'highs').objective))
+    assert results[0] == results[1] == (results[0][0], 2240.0)
+
+
+def test_defect_free_material_is_a_single_interval(capsys):
+    instance = instances.question_1()
+    patterns = cutting.generate_patterns(instance.materials, instance.segments, use_cache=False, workers=1,
+                                         **instance.options)
+    result = cutting.solve(patterns, instance.segments)
+    summary = cutting.report(patterns, instance.segments, result)
+    assert summary.fulfilled and round(summary.total_cost, 2) == 1738.0
+    assert '最优总成本: 1738.0元' in capsys.readouterr().out
+
+def test_stock_supply_limits_each_material_group():
+    instance = instances.question_1()
+    # 不限库存时最优解用 16 根 6.2m，库存只有 2 根
+    materials = [cutting.Material(6.2, 22, stock=2), cutting.Material(5.5, 18, stock=100),
+                 cutting.Material(7.8, 28)]
+    supply = cutting.stock_supply(materials)
+    assert supply == [2, 100, None]
+    patterns = cutting.generate_patterns(materials, instance.segments, use_cache=False, workers=1,
+                                         **instance.options)
+    free = cutting.solve(patterns, instance.segments, 'highs')
+    limited = cutting.solve(patterns, instance.segments, 'highs', supply)
+    assert limited.feasible and limited.objective > free.objective
+    assert np.bincount(patterns.group, weights=limited.x, minlength=3)[0] <= 2
+
+
+def test_package_import_does_not_load_solver_or_plotting_libraries():
+    code = ("import sys, cutting; cutting.generate_patterns, cutting.solve; "
+            "print(sorted(m for m in ('pulp', 'pandas', 'plotly') if m in sys.modules))")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert out.strip() == '[]'
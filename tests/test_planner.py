@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+import pytest
+
+from cutting import instances
+from cutting.planner import CuttingPlanner
+
+
+def _problem():
+    # 'order 1-width' 这样的零件名里的空格和 '-' 会被 PuLP 改写
+    segments = [dict(seg, name=seg['name'].replace('order', 'order ').replace('_', '-'))
+                for seg in instances.question_1().segments]
+    return instances.question_1().materials, segments
+
+
+def test_update_demands_then_warm_solve_matches_cold_solve():
+    materials, segments = _problem()
+    planner = CuttingPlanner.from_materials(materials, segments, use_cache=False)
+    assert planner.solve().optimal
+    name = segments[0]['name']
+    assert ' ' in name and '-' in name
+
+    planner.update_demands({name: 3})
+    warm = planner.solve()
+    cold = CuttingPlanner.from_materials(materials, [dict(seg, demand=3) if seg['name'] == name else seg
+                                                     for seg in segments], use_cache=False).solve()
+    assert warm.optimal and cold.optimal
+    assert warm.objective == pytest.approx(cold.objective)
+    assert planner.segments[0]['demand'] == 3 and segments[0]['demand'] != 3
+
+    with pytest.raises(KeyError):
+        planner.update_demands({'no such part': 1})
+
+
+def test_dataclass_inputs_without_cbc_do_not_load_pulp():
+    code = ("import sys, cutting; from cutting.planner import CuttingPlanner; "
+            "planner = CuttingPlanner.from_materials([cutting.Material(6.2, 22, stock=1)], "
+            "[cutting.Segment('w', 1.6, 5)], use_cache=False, finite_stock=True, backend='highs'); "
+            "result = planner.solve(); print(planner.supply, result.feasible, 'pulp' in sys.modules)")
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    assert out.split() == ['[1]', 'False', 'False']
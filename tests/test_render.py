@@ -0,0 +1,23 @@
+import numpy as np
+
+import cutting
+from cutting import instances, metrics, render
+
+
+def test_report_data_and_render_follow_the_solution(tmp_path):
+    instance = instances.question_1()
+    patterns = cutting.generate_patterns(instance.materials, instance.segments, use_cache=False, workers=1,
+                                         **instance.options)
+    result = cutting.solve(patterns, instance.segments)
+    summary = metrics.compute_metrics(patterns, instance.segments, result.x, metrics.order_revenue(instance.segments))
+    data = render.report_data('q1', patterns, instance.segments, result.x, summary)
+
+    used = np.flatnonzero(result.x > 0)
+    assert data.pattern_labels == [f"P{i + 1}" for i in used]
+    assert data.usage.sum() == result.x.sum()
+    assert data.material_labels == ['5.5m', '6.2m', '7.8m']
+    assert round(data.total_cost, 2) == 1738.0
+
+    paths = render.render_reports([data], str(tmp_path), formats=('png', 'svg'), workers=1)[0]
+    assert len(paths) == len(render.CHARTS) * 2
+    assert all((tmp_path / p.rsplit('/', 1)[-1]).stat().st_size > 0 for p in paths)
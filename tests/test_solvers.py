@@ -0,0 +1,39 @@
+"""三个求解后端在同一有限库存算例上的可行性与一致性"""
+
+import numpy as np
+import pytest
+
+from cutting import core, instances, model, pipeline, solvers
+
+
+@pytest.fixture(scope='module')
+def problem():
+    # 问题三需求缩小到 1/8，库存约束会起作用
+    instance = instances.question_3()
+    segments = [dict(seg, demand=-(-seg['demand'] // 8)) for seg in instance.segments]
+    supply = [group['count'] for group in core.group_materials(instance.materials)]
+    patterns = pipeline.generate_patterns(instance.materials, segments, use_cache=False, workers=1,
+                                          **instance.options)
+    return patterns, segments, supply
+
+
+@pytest.fixture(scope='module')
+def results(problem):
+    return {name: solvers.get_backend(name).solve(*problem) for name in solvers.BACKENDS}
+
+
+@pytest.mark.parametrize('backend', list(solvers.BACKENDS))
+def test_backend_is_feasible_within_supply(problem, results, backend):
+    patterns, segments, supply = problem
+    result = results[backend]
+    assert result.feasible and result.backend == backend
+    assert np.all(model.pattern_matrix(patterns).T @ result.x >= [seg['demand'] for seg in segments])
+    stock, available = model.supply_matrix(patterns, supply)
+    assert np.all(stock @ result.x <= available)
+    assert result.objective == pytest.approx(float(patterns.cost @ result.x))
+
+
+def test_exact_backends_agree(results):
+    assert results['cbc'].optimal and results['highs'].optimal
+    assert results['cbc'].objective == pytest.approx(results['highs'].objective) == 1058.6
+    assert results['lp-round'].objective >= results['highs'].objective - 1e-6
@@ -0,0 +1,63 @@
+import math
+
+import pytest
+
+from cutting import stock
+
+NAN = math.nan
+
+
+def test_string_ids_merge_rows_of_one_bar():
+    materials = stock.materials_from_columns(['A', 'A', 'B'], [6.0, 6.0, 5.0], [3.0, 1.0, NAN], [0.1, 0.2, NAN],
+                                             [20, 20, 18])
+    assert materials == [
+        {'id': 'A', 'length': 6.0, 'cost': 20.0,
+         'defects': [{'start': 1.0, 'length': 0.2}, {'start': 3.0, 'length': 0.1}]},
+        {'id': 'B', 'length': 5.0, 'cost': 18.0, 'defects': []},
+    ]
+
+
+def test_mixed_ids_keep_first_appearance_order():
+    materials = stock.materials_from_columns(['B7', 3, 'B7', 1], [6.0, 5.5, 6.0, 5.5], [1.0, NAN, 2.0, 0.5],
+                                             [0.1, NAN, 0.1, 0.1], [21, 18, 22, 18])
+    assert [m['id'] for m in materials] == ['B7', 3, 1]
+    # 单价取该编号的第一行
+    assert materials[0]['cost'] == 21.0
+    assert len(materials[0]['defects']) == 2
+
+
+def test_invalid_defects_report_ids():
+    with pytest.raises(ValueError, match="'A'"):
+        stock.materials_from_columns(['A', 'A'], [6.0, 6.0], [1.0, 1.05], [0.1, 0.1], [20, 20])
+    with pytest.raises(ValueError, match="超出"):
+        stock.materials_from_columns(['A', 2], [6.0, 6.0], [5.95, NAN], [0.1, NAN], [20, 20])
+
+
+def _write_workbook(path, ids):
+    import pandas as pd
+
+    pd.DataFrame({
+        stock.ID_COLUMN: ids,
+        stock.LENGTH_COLUMN: [6.0, 6.0, 5.0, 2.0],
+        stock.DEFECT_START_COLUMN: [1.0, 3.0, NAN, 0.5],
+        stock.DEFECT_LENGTH_COLUMN: [0.1, 0.2, NAN, 0.1],
+        stock.COST_COLUMN: [20, 20, 18, 8],
+    }).to_excel(path, sheet_name='Sheet1', index=False)
+
+
+def test_snapshot_load_matches_cold_load(tmp_path):
+    path = str(tmp_path / 'stock.xlsx')
+    _write_workbook(path, ['A', 'A', 7, 'C'])
+    cold = stock.load_materials(path)
+    assert (tmp_path / 'stock.xlsx.snapshot.npy').exists()
+    assert stock.load_materials(path) == cold
+    assert [m['id'] for m in cold] == ['A', 7, 'C']
+
+
+def test_missing_id_rejected_before_snapshot(tmp_path):
+    path = str(tmp_path / 'stock.xlsx')
+    _write_workbook(path, ['A', 'A', 'B', None])
+    for _ in range(2):
+        with pytest.raises(ValueError, match="编号为空"):
+            stock.load_materials(path)
+    assert not (tmp_path / 'stock.xlsx.snapshot.json').exists()
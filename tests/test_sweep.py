@@ -0,0 +1,30 @@
+import pandas as pd
+
+from cutting import sweep
+
+COLUMNS = ['scenario', 'type', 'name', 'length', 'demand', 'price', 'cost', 'defect_start', 'defect_length',
+           'count', 'options']
+
+
+def _scenario(name, options=None, count=None):
+    # 4 根 1.6m 加 3 道锯缝正好 6.415m：末刀免锯缝时一根够用，否则要两根
+    return [[name, 'segment', 'a', 1.6, 4, 100, None, None, None, None, options],
+            [name, 'material', 'bar', 6.415, None, None, 10, None, None, count, options]]
+
+
+def test_sweep_applies_per_scenario_options(tmp_path):
+    df = pd.DataFrame(_scenario('free_end', 'free_end_cut') + _scenario('kerf') + _scenario('short', count=1),
+                      columns=COLUMNS)
+    scenarios = sweep.parse_scenarios(df)
+    assert scenarios['free_end'][2] == ('free_end_cut',) and scenarios['kerf'][2] is None
+
+    results = sweep.run_sweep(scenarios, workers=1, backend_name='highs', cache_dir=tmp_path / 'cache',
+                              report_dir=tmp_path / 'reports').set_index('scenario')
+    assert results.loc['free_end', 'cost'] == 10 and results.loc['kerf', 'cost'] == 20
+    assert results.loc['short', 'status'] == 'infeasible'  # 要切两根，库存只有一根
+    assert len(list((tmp_path / 'cache').iterdir())) == 2  # kerf 与 short 只差库存，共用一份模式库
+    assert sorted(p.name for p in (tmp_path / 'reports').iterdir())[0] == 'free_end_financial.png'
+
+    # 情景没有指定时用命令行的默认规则
+    assert sweep.run_sweep({'kerf': scenarios['kerf']}, workers=1, backend_name='highs', cache_dir=tmp_path / 'cache',
+                           flags=('free_end_cut',)).loc[0, 'cost'] == 10